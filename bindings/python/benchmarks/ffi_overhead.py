@@ -10,10 +10,18 @@ Run with:
     or use: python3 benchmarks/ffi_overhead.py
 """
 
+import functools
+import gc
+import io
+import statistics
+import time
 import timeit
 import sys
 import json
-from typing import Dict, List, Tuple
+from array import array
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 import os
 
 # Add parent directory to path for imports
@@ -21,11 +29,23 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import hedl
 
+# Display order for document sizes in the summary table.
+SIZE_ORDER = {"small": 0, "medium": 1, "large": 2}
+
+# Minimum wall time per sample; mirrors timeit.Timer.autorange()'s 0.2 s target.
+MIN_SAMPLE_NS = 200_000_000
+
 
 # Test data generators
-def generate_small_hedl() -> str:
+#
+# Corpora are built once per process and cached as UTF-8 bytes, which parse()
+# and validate() hand to the FFI layer without re-encoding. Rows are formatted
+# straight into a BytesIO with bytes %-formatting, so no intermediate str
+# lines are created.
+@functools.lru_cache(maxsize=None)
+def generate_small_hedl() -> bytes:
     """Generate small HEDL document."""
-    return """%VERSION: 1.0
+    return b"""%VERSION: 1.0
 %STRUCT: User: [id, name, email]
 ---
 users: @User
@@ -34,68 +54,112 @@ users: @User
 """
 
 
-def generate_medium_hedl() -> str:
+@functools.lru_cache(maxsize=None)
+def generate_medium_hedl() -> bytes:
     """Generate medium HEDL document."""
-    lines = ["%VERSION: 1.0", "%STRUCT: User: [id, name, email, dept]", "---", "users: @User"]
+    buf = io.BytesIO()
+    buf.write(b"%VERSION: 1.0\n%STRUCT: User: [id, name, email, dept]\n---\nusers: @User")
     for i in range(100):
-        lines.append(f"  | {i}, User{i}, user{i}@example.com, dept{i%10}")
-    return "\n".join(lines)
+        buf.write(b"\n  | %d, User%d, user%d@example.com, dept%d" % (i, i, i, i % 10))
+    return buf.getvalue()
 
 
-def generate_large_hedl() -> str:
+@functools.lru_cache(maxsize=None)
+def generate_large_hedl() -> bytes:
     """Generate large HEDL document."""
-    lines = ["%VERSION: 1.0", "%STRUCT: User: [id, name, email, dept, salary]", "---", "users: @User"]
+    buf = io.BytesIO()
+    buf.write(b"%VERSION: 1.0\n%STRUCT: User: [id, name, email, dept, salary]\n---\nusers: @User")
     for i in range(1000):
-        lines.append(f"  | {i}, User{i}, user{i}@example.com, dept{i%10}, {50000 + i*100}")
-    return "\n".join(lines)
+        buf.write(
+            b"\n  | %d, User%d, user%d@example.com, dept%d, %d"
+            % (i, i, i, i % 10, 50000 + i * 100)
+        )
+    return buf.getvalue()
+
+
+def _parse_many_and_close(batch: List[bytes], cache: bool = False) -> None:
+    """Parse a batch and release every resulting Document."""
+    for doc in hedl.parse_many(batch, cache=cache):
+        doc.close()
 
 
 class BenchmarkResult:
-    """Stores benchmark results for a single operation."""
+    """Stores benchmark results for a single operation.
+
+    Each sample is the raw integer nanosecond total of `calls_per_sample`
+    back-to-back calls, written into a preallocated array('q'). Statistics
+    are computed once by finalize() and cached as per-call floats, so the
+    summary and JSON export do not rescan the samples.
+    """
 
-    def __init__(self, name: str, operation: str, size: str):
+    def __init__(self, name: str, operation: str, size: str, capacity: int,
+                 calls_per_sample: int = 1):
         self.name = name
         self.operation = operation
         self.size = size
-        self.times: List[float] = []
+        self.calls_per_sample = calls_per_sample
+        self.times = array('q', bytes(8 * capacity))
+        self._n = 0
+        self._stats: Optional[Tuple[float, float, float, float]] = None
         self.overhead_percent = 0.0
 
-    def add_time(self, time_ns: float):
-        """Add a measurement in nanoseconds."""
-        self.times.append(time_ns)
+    def add_time(self, time_ns: int):
+        """Add a sample total in nanoseconds."""
+        self.times[self._n] = time_ns
+        self._n += 1
+        self._stats = None
+
+    @property
+    def samples(self) -> memoryview:
+        """Recorded samples (view of the filled part of the buffer)."""
+        return memoryview(self.times)[:self._n]
+
+    def finalize(self) -> Tuple[float, float, float, float]:
+        """Compute and cache (avg, min, max, std dev) per call in nanoseconds."""
+        if self._stats is None:
+            if not self._n:
+                self._stats = (0, 0, 0, 0)
+            else:
+                samples = self.samples
+                scale = self.calls_per_sample
+                std = statistics.stdev(samples) / scale if self._n >= 2 else 0
+                self._stats = (
+                    statistics.fmean(samples) / scale,
+                    min(samples) / scale,
+                    max(samples) / scale,
+                    std,
+                )
+        return self._stats
 
     def avg_time_ns(self) -> float:
-        """Get average time in nanoseconds."""
-        return sum(self.times) / len(self.times) if self.times else 0
+        """Get average time per call in nanoseconds."""
+        return self.finalize()[0]
 
     def min_time_ns(self) -> float:
-        """Get minimum time in nanoseconds."""
-        return min(self.times) if self.times else 0
+        """Get minimum time per call in nanoseconds."""
+        return self.finalize()[1]
 
     def max_time_ns(self) -> float:
-        """Get maximum time in nanoseconds."""
-        return max(self.times) if self.times else 0
+        """Get maximum time per call in nanoseconds."""
+        return self.finalize()[2]
 
     def std_dev_ns(self) -> float:
-        """Get standard deviation in nanoseconds."""
-        if len(self.times) < 2:
-            return 0
-        avg = self.avg_time_ns()
-        variance = sum((t - avg) ** 2 for t in self.times) / (len(self.times) - 1)
-        return variance ** 0.5
+        """Get standard deviation per call in nanoseconds."""
+        return self.finalize()[3]
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        avg, min_, max_, std = self.finalize()
         return {
             "name": self.name,
             "operation": self.operation,
             "size": self.size,
-            "avg_time_ns": round(self.avg_time_ns(), 2),
-            "min_time_ns": round(self.min_time_ns(), 2),
-            "max_time_ns": round(self.max_time_ns(), 2),
-            "std_dev_ns": round(self.std_dev_ns(), 2),
+            "avg_time_ns": round(avg, 2),
+            "min_time_ns": round(min_, 2),
+            "max_time_ns": round(max_, 2),
+            "std_dev_ns": round(std, 2),
             "overhead_percent": round(self.overhead_percent, 2),
-            "samples": len(self.times),
+            "samples": self._n,
         }
 
 
@@ -105,96 +169,129 @@ class BenchmarkSuite:
     def __init__(self):
         self.results: List[BenchmarkResult] = []
 
-    def benchmark_parse(self, hedl_content: str, size: str, iterations: int = 10):
-        """Benchmark parse operation."""
+    @staticmethod
+    def _measure(op, repeat: int) -> Tuple[List[int], int]:
+        """
+        Time op with the integer perf_counter_ns clock.
+
+        `op` is called with no arguments; benchmarks pass bound methods or
+        functools.partial objects rather than closures, so each timed call
+        does not go through an extra Python frame.
+
+        Returns `repeat` raw nanosecond totals plus the number of calls in
+        each. The loop count is doubled until one sample takes at least
+        MIN_SAMPLE_NS, so sub-microsecond operations are not swamped by timer
+        overhead; garbage collection is disabled for the whole measurement.
+        """
+        timer = timeit.Timer(op, timer=time.perf_counter_ns)
+        gc.disable()
+        try:
+            number = 1
+            while timer.timeit(number) < MIN_SAMPLE_NS:
+                number *= 2
+            totals = timer.repeat(repeat=repeat, number=number)
+        finally:
+            gc.enable()
+        return totals, number
+
+    def _record(self, name: str, operation: str, size: str,
+                measurement: Tuple[List[int], int], per_call: int = 1):
+        """
+        Store a result and print its best per-call time.
+
+        `per_call` divides the result for ops that process several documents
+        per invocation.
+        """
+        totals, number = measurement
+        result = BenchmarkResult(name, operation, size, capacity=len(totals),
+                                 calls_per_sample=number * per_call)
+        for t in totals:
+            result.add_time(t)
+        result.finalize()
+        self.results.append(result)
+        print(f"  Best: {result.min_time_ns():.0f} ns")
+
+    def benchmark_parse(self, hedl_content: bytes, size: str, iterations: int = 10):
+        """
+        Benchmark parse operation, recycling a single Document.
+
+        The uncached row parses from scratch on every call; the cached row
+        passes cache=True and measures the hash-and-lookup path on its own.
+        """
         print(f"\nBenchmarking parse ({size})...")
 
-        def parse_op():
-            doc = hedl.parse(hedl_content)
+        hedl.clear_parse_cache()
+        doc = hedl.parse(hedl_content)
+        parse_op = functools.partial(doc.reparse, hedl_content)
+        cached_op = functools.partial(doc.reparse, hedl_content, cache=True)
+
+        try:
+            self._record("parse", "Parse HEDL", size, self._measure(parse_op, iterations))
+            self._record("parse_cached", "Parse HEDL (cached)", size,
+                         self._measure(cached_op, iterations))
+        finally:
             doc.close()
+            hedl.clear_parse_cache()
 
-        times = []
-        for _ in range(iterations):
-            start = timeit.default_timer()
-            parse_op()
-            elapsed = (timeit.default_timer() - start) * 1e9  # Convert to ns
-            times.append(elapsed)
+    def benchmark_parse_many(self, hedl_content: bytes, size: str, iterations: int = 10,
+                             batch_size: int = 100):
+        """Benchmark batched parse operation (time reported per document)."""
+        print(f"\nBenchmarking parse_many ({size}, batch of {batch_size})...")
 
-        result = BenchmarkResult("parse", "Parse HEDL", size)
-        for t in times:
-            result.add_time(t)
-        self.results.append(result)
-        print(f"  Average: {result.avg_time_ns():.0f} ns")
+        hedl.clear_parse_cache()
+        batch = [hedl_content] * batch_size
+        parse_many_op = functools.partial(_parse_many_and_close, batch)
+        cached_op = functools.partial(_parse_many_and_close, batch, cache=True)
 
-    def benchmark_to_json(self, hedl_content: str, size: str, iterations: int = 10):
+        try:
+            self._record("parse_many", "Parse HEDL (batched)", size,
+                         self._measure(parse_many_op, iterations), per_call=batch_size)
+            self._record("parse_many_cached", "Parse HEDL (batched, cached)", size,
+                         self._measure(cached_op, iterations), per_call=batch_size)
+        finally:
+            hedl.clear_parse_cache()
+
+    def benchmark_to_json(self, hedl_content: bytes, size: str, iterations: int = 10):
         """Benchmark to_json conversion."""
         print(f"\nBenchmarking to_json ({size})...")
 
         doc = hedl.parse(hedl_content)
 
-        def to_json_op():
-            return doc.to_json()
+        try:
+            self._record("to_json", "Convert to JSON", size, self._measure(doc.to_json, iterations))
+        finally:
+            doc.close()
+
+    def benchmark_to_json_into(self, hedl_content: bytes, size: str, iterations: int = 10):
+        """Benchmark to_json_into conversion into one reused buffer."""
+        print(f"\nBenchmarking to_json_into ({size})...")
+
+        doc = hedl.parse(hedl_content)
+        to_json_into_op = functools.partial(doc.to_json_into, bytearray(1 << 20))
 
-        times = []
         try:
-            for _ in range(iterations):
-                start = timeit.default_timer()
-                to_json_op()
-                elapsed = (timeit.default_timer() - start) * 1e9  # Convert to ns
-                times.append(elapsed)
-
-            result = BenchmarkResult("to_json", "Convert to JSON", size)
-            for t in times:
-                result.add_time(t)
-            self.results.append(result)
-            print(f"  Average: {result.avg_time_ns():.0f} ns")
+            self._record("to_json_into", "Convert to JSON (into buffer)", size,
+                         self._measure(to_json_into_op, iterations))
         finally:
             doc.close()
 
-    def benchmark_to_yaml(self, hedl_content: str, size: str, iterations: int = 10):
+    def benchmark_to_yaml(self, hedl_content: bytes, size: str, iterations: int = 10):
         """Benchmark to_yaml conversion."""
         print(f"\nBenchmarking to_yaml ({size})...")
 
         doc = hedl.parse(hedl_content)
 
-        def to_yaml_op():
-            return doc.to_yaml()
-
-        times = []
         try:
-            for _ in range(iterations):
-                start = timeit.default_timer()
-                to_yaml_op()
-                elapsed = (timeit.default_timer() - start) * 1e9  # Convert to ns
-                times.append(elapsed)
-
-            result = BenchmarkResult("to_yaml", "Convert to YAML", size)
-            for t in times:
-                result.add_time(t)
-            self.results.append(result)
-            print(f"  Average: {result.avg_time_ns():.0f} ns")
+            self._record("to_yaml", "Convert to YAML", size, self._measure(doc.to_yaml, iterations))
         finally:
             doc.close()
 
-    def benchmark_validate(self, hedl_content: str, size: str, iterations: int = 10):
+    def benchmark_validate(self, hedl_content: bytes, size: str, iterations: int = 10):
         """Benchmark validate operation."""
         print(f"\nBenchmarking validate ({size})...")
 
-        def validate_op():
-            return hedl.validate(hedl_content)
-
-        times = []
-        for _ in range(iterations):
-            start = timeit.default_timer()
-            validate_op()
-            elapsed = (timeit.default_timer() - start) * 1e9  # Convert to ns
-            times.append(elapsed)
-
-        result = BenchmarkResult("validate", "Validate HEDL", size)
-        for t in times:
-            result.add_time(t)
-        self.results.append(result)
-        print(f"  Average: {result.avg_time_ns():.0f} ns")
+        validate_op = functools.partial(hedl.validate, hedl_content)
+        self._record("validate", "Validate HEDL", size, self._measure(validate_op, iterations))
 
     def run_all(self):
         """Run all benchmarks."""
@@ -214,40 +311,42 @@ class BenchmarkSuite:
             print(f"{'='*70}")
 
             self.benchmark_parse(content, size_name, iterations)
+            self.benchmark_parse_many(content, size_name, iterations)
             self.benchmark_validate(content, size_name, iterations)
             self.benchmark_to_json(content, size_name, iterations)
+            self.benchmark_to_json_into(content, size_name, iterations)
             self.benchmark_to_yaml(content, size_name, iterations)
 
     def print_summary(self):
         """Print summary of all benchmarks."""
-        print("\n" + "=" * 70)
-        print("BENCHMARK SUMMARY")
-        print("=" * 70)
+        buf = io.StringIO()
+        buf.write("\n" + "=" * 70 + "\n")
+        buf.write("BENCHMARK SUMMARY\n")
+        buf.write("=" * 70 + "\n")
 
         # Group by operation
-        operations = {}
+        operations = defaultdict(list)
         for result in self.results:
-            key = result.operation
-            if key not in operations:
-                operations[key] = []
-            operations[key].append(result)
+            operations[result.operation].append(result)
 
         for op_name, op_results in sorted(operations.items()):
-            print(f"\n{op_name}:")
-            print(f"  {'Size':<10} {'Avg (ns)':<15} {'Min (ns)':<15} {'Max (ns)':<15} {'StdDev':<15}")
-            print("  " + "-" * 70)
-            for result in sorted(op_results, key=lambda r: int(r.size == "small") or int(r.size == "medium") or 2):
-                print(
+            buf.write(f"\n{op_name}:\n")
+            buf.write(f"  {'Size':<10} {'Avg (ns)':<15} {'Min (ns)':<15} {'Max (ns)':<15} {'StdDev':<15}\n")
+            buf.write("  " + "-" * 70 + "\n")
+            for result in sorted(op_results, key=lambda r: SIZE_ORDER.get(r.size, 99)):
+                buf.write(
                     f"  {result.size:<10} {result.avg_time_ns():<15.0f} "
                     f"{result.min_time_ns():<15.0f} {result.max_time_ns():<15.0f} "
-                    f"{result.std_dev_ns():<15.0f}"
+                    f"{result.std_dev_ns():<15.0f}\n"
                 )
 
+        sys.stdout.write(buf.getvalue())
+
     def export_json(self, filename: str = "ffi_overhead_results.json"):
         """Export results to JSON file."""
         data = {
             "benchmark": "HEDL Python FFI Overhead",
-            "timestamp": __import__("datetime").datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "results": [r.to_dict() for r in self.results],
         }
 
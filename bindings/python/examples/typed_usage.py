@@ -105,20 +105,24 @@ def convert_to_json(doc: hedl.Document, pretty: bool = True) -> str:
     return json_output
 
 
-def convert_to_parquet(doc: hedl.Document) -> bytes:
+def convert_to_parquet(doc: hedl.Document, zero_copy: bool = False) -> Union[memoryview, bytes]:
     """
     Convert HEDL document to Parquet format.
 
     Args:
         doc: HEDL document with matrix list structure
+        zero_copy: Return a memoryview over the native buffer instead of
+                   copying it into bytes (e.g. to hand to pyarrow or a file)
 
     Returns:
-        Parquet file contents as bytes
+        Parquet file contents as a memoryview or bytes
 
     Raises:
         hedl.HedlError: If document structure is incompatible
     """
     try:
+        if zero_copy:
+            return doc.to_parquet_view()
         parquet_data: bytes = doc.to_parquet()
         return parquet_data
     except hedl.HedlError as e:
@@ -179,23 +183,36 @@ def lint_document(doc: hedl.Document) -> tuple[list[str], list[str], list[str]]:
         Tuple of (errors, warnings, hints)
     """
     with doc.lint() as diag:
-        errors: list[str] = diag.errors
-        warnings: list[str] = diag.warnings
-        hints: list[str] = diag.hints
-
-        # Iterate over all diagnostics
-        for message, severity in diag:
-            severity_str: str
-            if severity == hedl.SEVERITY_ERROR:
-                severity_str = "ERROR"
-            elif severity == hedl.SEVERITY_WARNING:
-                severity_str = "WARNING"
-            elif severity == hedl.SEVERITY_HINT:
-                severity_str = "HINT"
-            else:
-                severity_str = "UNKNOWN"
-
-            print(f"[{severity_str}] {message}")
+        return report_diagnostics(diag)
+
+
+def report_diagnostics(diag: hedl.Diagnostics) -> tuple[list[str], list[str], list[str]]:
+    """
+    Print and categorize lint diagnostics.
+
+    Args:
+        diag: Diagnostics returned by Document.lint() or hedl.parse_and_lint()
+
+    Returns:
+        Tuple of (errors, warnings, hints)
+    """
+    errors: list[str] = diag.errors
+    warnings: list[str] = diag.warnings
+    hints: list[str] = diag.hints
+
+    # Iterate over all diagnostics
+    for message, severity in diag:
+        severity_str: str
+        if severity == hedl.SEVERITY_ERROR:
+            severity_str = "ERROR"
+        elif severity == hedl.SEVERITY_WARNING:
+            severity_str = "WARNING"
+        elif severity == hedl.SEVERITY_HINT:
+            severity_str = "HINT"
+        else:
+            severity_str = "UNKNOWN"
+
+        print(f"[{severity_str}] {message}")
 
     return (errors, warnings, hints)
 
@@ -210,12 +227,14 @@ def validate_with_diagnostics(content: str) -> bool:
     Returns:
         True if no errors found, False otherwise
     """
-    if not hedl.validate(content):
+    try:
+        doc, diag = hedl.parse_and_lint(content)
+    except hedl.HedlError:
         print("Validation failed - invalid HEDL syntax")
         return False
 
-    with hedl.parse(content) as doc:
-        errors, warnings, hints = lint_document(doc)
+    with doc, diag:
+        errors, warnings, hints = report_diagnostics(diag)
 
         print(f"Linting results: {len(errors)} errors, "
               f"{len(warnings)} warnings, {len(hints)} hints")
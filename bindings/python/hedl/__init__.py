@@ -15,12 +15,23 @@ from .core import (
     Document,
     Diagnostics,
     HedlError,
+    ResourceLimiter,
     parse,
+    parse_bytes,
+    parse_many,
+    parse_and_lint,
     validate,
+    validate_bytes,
+    parse_file,
+    validate_file,
     from_json,
+    from_json_bytes,
     from_yaml,
+    from_yaml_bytes,
     from_xml,
+    from_xml_bytes,
     from_parquet,
+    clear_parse_cache,
 )
 
 from .lib import get_library_path, load_library
@@ -30,12 +41,23 @@ __all__ = [
     "Document",
     "Diagnostics",
     "HedlError",
+    "ResourceLimiter",
     "parse",
+    "parse_bytes",
+    "parse_many",
+    "parse_and_lint",
     "validate",
+    "validate_bytes",
+    "parse_file",
+    "validate_file",
     "from_json",
+    "from_json_bytes",
     "from_yaml",
+    "from_yaml_bytes",
     "from_xml",
+    "from_xml_bytes",
     "from_parquet",
+    "clear_parse_cache",
     "get_library_path",
     "load_library",
 ]
@@ -24,12 +24,23 @@ from .core import (
     Document as Document,
     Diagnostics as Diagnostics,
     HedlError as HedlError,
+    ResourceLimiter as ResourceLimiter,
     parse as parse,
+    parse_bytes as parse_bytes,
+    parse_many as parse_many,
+    parse_and_lint as parse_and_lint,
     validate as validate,
+    validate_bytes as validate_bytes,
+    parse_file as parse_file,
+    validate_file as validate_file,
     from_json as from_json,
+    from_json_bytes as from_json_bytes,
     from_yaml as from_yaml,
+    from_yaml_bytes as from_yaml_bytes,
     from_xml as from_xml,
+    from_xml_bytes as from_xml_bytes,
     from_parquet as from_parquet,
+    clear_parse_cache as clear_parse_cache,
     HEDL_OK as HEDL_OK,
     HEDL_ERR_NULL_PTR as HEDL_ERR_NULL_PTR,
     HEDL_ERR_INVALID_UTF8 as HEDL_ERR_INVALID_UTF8,
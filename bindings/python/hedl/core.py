@@ -21,6 +21,16 @@ Concurrent access without proper synchronization may result in:
 Python's GIL (Global Interpreter Lock) does NOT protect against these
 issues because FFI calls release the GIL during execution.
 
+Module-level functions (parse, parse_many, validate, from_json, ...) may be
+called from several threads at once, and ctypes releases the GIL for the
+duration of each native call. Each call returns a new Document with its own
+native handle, so "separate Document instances per thread" above holds.
+
+The exception is parse(..., cache=True): its lock only guards the cache's
+bookkeeping. Documents it returns for identical source share one native
+handle, so they count as a single document for the rules above, even when
+each thread holds its own Document object.
+
 RESOURCE LIMITS:
 ===============
 The HEDL_MAX_OUTPUT_SIZE environment variable controls the maximum size of
@@ -48,11 +58,22 @@ Use Cases:
 
 When the limit is exceeded, operations will raise HedlError with code
 HEDL_ERR_ALLOC and a message suggesting to increase HEDL_MAX_OUTPUT_SIZE.
+
+The environment variable only sets the default. Limits can also be set per
+document at runtime by passing a ResourceLimiter to parse(), from_json(), etc.:
+
+    limiter = hedl.ResourceLimiter(max_output_size=1 << 30, max_input_size=1 << 28)
+    doc = hedl.parse(content, limiter=limiter)
 """
 
 import ctypes
+import hashlib
+import mmap
 import os
-from typing import Optional, Tuple, List, Union
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional, Tuple, List, Union
 from .lib import load_library
 from .errors import (
     format_standardized_error,
@@ -81,6 +102,55 @@ from .errors import (
 # Set HEDL_MAX_OUTPUT_SIZE environment variable before importing to customize.
 MAX_OUTPUT_SIZE = int(os.getenv('HEDL_MAX_OUTPUT_SIZE', '104857600'))  # 100MB default
 
+# The shared library is loaded once at import. Every FFI entry point is bound
+# to a module global so method bodies do a single global lookup instead of
+# load_library() plus CDLL attribute resolution on every call. Out-parameters
+# are passed as plain ctypes instances: every such argument is declared as a
+# POINTER type in lib.py, so ctypes takes the address itself without a
+# separate byref() call.
+_LIB = load_library()
+_HedlDocumentPtr = _LIB.HedlDocumentPtr
+_HedlDiagnosticsPtr = _LIB.HedlDiagnosticsPtr
+_HedlOutputCallback = _LIB.HedlOutputCallback
+
+_hedl_get_last_error = _LIB.hedl_get_last_error
+_hedl_free_string = _LIB.hedl_free_string
+_hedl_free_bytes = _LIB.hedl_free_bytes
+_hedl_free_document = _LIB.hedl_free_document
+_hedl_free_diagnostics = _LIB.hedl_free_diagnostics
+
+_hedl_parse = _LIB.hedl_parse
+_hedl_validate = _LIB.hedl_validate
+_hedl_from_json = _LIB.hedl_from_json
+_hedl_from_yaml = _LIB.hedl_from_yaml
+_hedl_from_xml = _LIB.hedl_from_xml
+_hedl_from_parquet = _LIB.hedl_from_parquet
+
+_hedl_get_version = _LIB.hedl_get_version
+_hedl_schema_count = _LIB.hedl_schema_count
+_hedl_alias_count = _LIB.hedl_alias_count
+_hedl_root_item_count = _LIB.hedl_root_item_count
+
+_hedl_canonicalize = _LIB.hedl_canonicalize
+_hedl_to_json = _LIB.hedl_to_json
+_hedl_to_json_callback = _LIB.hedl_to_json_callback
+_hedl_to_yaml = _LIB.hedl_to_yaml
+_hedl_to_xml = _LIB.hedl_to_xml
+_hedl_to_csv = _LIB.hedl_to_csv
+_hedl_to_parquet = _LIB.hedl_to_parquet
+_hedl_to_neo4j_cypher = _LIB.hedl_to_neo4j_cypher
+
+_hedl_lint = _LIB.hedl_lint
+_hedl_diagnostics_count = _LIB.hedl_diagnostics_count
+_hedl_diagnostics_get = _LIB.hedl_diagnostics_get
+_hedl_diagnostics_severity = _LIB.hedl_diagnostics_severity
+
+# Bounds of the opt-in parse(..., cache=True) cache: the number of parsed
+# documents it keeps alive, and the total size of their sources in bytes.
+# Larger sources are parsed but never cached.
+PARSE_CACHE_SIZE = 128
+PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+
 # Severity levels
 SEVERITY_HINT = 0
 SEVERITY_WARNING = 1
@@ -119,8 +189,7 @@ class HedlError(Exception):
         Returns:
             HedlError with standardized message format.
         """
-        lib = load_library()
-        error_msg = lib.hedl_get_last_error()
+        error_msg = _hedl_get_last_error()
         if error_msg:
             ffi_detail = error_msg.decode("utf-8")
         else:
@@ -132,33 +201,323 @@ class HedlError(Exception):
         return cls(message, code, {"operation": operation, "context": context, "ffi_detail": ffi_detail})
 
 
-def _check_output_size(output: Union[str, bytes], operation: str) -> None:
+class ResourceLimiter:
+    """
+    Size limits applied to the operations of a Document.
+
+    Every Document carries a limiter: the one passed to parse(), from_json(),
+    etc., or DEFAULT_LIMITER otherwise. Limits can therefore differ between
+    documents and be changed at runtime, without re-importing hedl.
+
+    Attributes:
+        max_output_size: Maximum conversion output size in bytes.
+        max_input_size: Maximum input size in bytes, or None for no limit.
+    """
+
+    def __init__(self, max_output_size: Optional[int] = None, max_input_size: Optional[int] = None):
+        self.max_output_size = MAX_OUTPUT_SIZE if max_output_size is None else max_output_size
+        self.max_input_size = max_input_size
+
+    def __repr__(self) -> str:
+        return (f"ResourceLimiter(max_output_size={self.max_output_size}, "
+                f"max_input_size={self.max_input_size})")
+
+    def check_output(self, output_size: int, operation: str) -> None:
+        """
+        Check an output size in bytes against max_output_size.
+
+        Args:
+            output_size: Output size in bytes
+            operation: Operation name for error message
+
+        Raises:
+            HedlError: If output exceeds size limit
+        """
+        if output_size > self.max_output_size:
+            actual_mb = output_size / 1048576
+            limit_mb = self.max_output_size / 1048576
+            detail = f"Output size ({actual_mb:.2f}MB) exceeds limit ({limit_mb:.2f}MB)"
+            requirement = "Increase HEDL_MAX_OUTPUT_SIZE environment variable or reduce document size"
+            raise HedlError(
+                format_resource_error(operation, detail, requirement),
+                HEDL_ERR_ALLOC
+            )
+
+    def check_input(self, input_size: int, operation: str) -> None:
+        """
+        Check an input size in bytes against max_input_size.
+
+        Args:
+            input_size: Input size in bytes
+            operation: Operation name for error message
+
+        Raises:
+            HedlError: If input exceeds size limit
+        """
+        if self.max_input_size is not None and input_size > self.max_input_size:
+            actual_mb = input_size / 1048576
+            limit_mb = self.max_input_size / 1048576
+            detail = f"Input size ({actual_mb:.2f}MB) exceeds limit ({limit_mb:.2f}MB)"
+            requirement = "Increase ResourceLimiter.max_input_size or reduce input size"
+            raise HedlError(
+                format_resource_error(operation, detail, requirement),
+                HEDL_ERR_ALLOC
+            )
+
+
+# Limiter used by Documents created without an explicit one.
+DEFAULT_LIMITER = ResourceLimiter()
+
+# hedl-ffi takes text input lengths as a C int and rejects anything above its
+# MAX_FFI_INPUT_LEN (1 GiB). ctypes silently truncates Python ints to 32 bits,
+# so a longer length would reach the library as a short prefix, or as a
+# negative value that makes it scan for a NUL terminator. Such lengths are
+# rejected here, before the call.
+_MAX_FFI_INPUT_LEN = min(2**31 - 1, 1024 * 1024 * 1024)
+
+
+def _check_ffi_input_len(input_size: int, operation: str) -> None:
     """
-    Check if output size exceeds MAX_OUTPUT_SIZE limit.
+    Check an input size in bytes against the FFI's input length limit.
 
     Args:
-        output: Output string or bytes to check
+        input_size: Input size in bytes
         operation: Operation name for error message
 
     Raises:
-        HedlError: If output exceeds size limit
+        HedlError: If the input is too long to pass to the library
     """
-    if isinstance(output, str):
-        output_size = len(output.encode('utf-8'))
-    else:
-        output_size = len(output)
-
-    if output_size > MAX_OUTPUT_SIZE:
-        actual_mb = output_size / 1048576
-        limit_mb = MAX_OUTPUT_SIZE / 1048576
-        detail = f"Output size ({actual_mb:.2f}MB) exceeds limit ({limit_mb:.2f}MB)"
-        requirement = "Increase HEDL_MAX_OUTPUT_SIZE environment variable or reduce document size"
+    if input_size > _MAX_FFI_INPUT_LEN:
+        actual_mb = input_size / 1048576
+        limit_mb = _MAX_FFI_INPUT_LEN / 1048576
+        detail = f"Input size ({actual_mb:.2f}MB) exceeds FFI limit ({limit_mb:.2f}MB)"
         raise HedlError(
-            format_resource_error(operation, detail, requirement),
+            format_resource_error(operation, detail, "Split the input into smaller documents"),
             HEDL_ERR_ALLOC
         )
 
 
+# Byte-level conversions go through the *_callback exports, which write straight
+# into the destination. There is one module-level sink per destination kind,
+# with the per-call state passed through a thread-local, so no CFUNCTYPE thunk
+# is built per call.
+_bytes_call = threading.local()
+
+
+@_HedlOutputCallback
+def _into_sink(data, length, _user_data):
+    # [export, address, capacity, length]
+    state = _bytes_call.state
+    state[3] = length
+    if 0 < length <= state[2]:
+        ctypes.memmove(state[1], data, length)
+
+
+@_HedlOutputCallback
+def _view_sink(data, length, _user_data):
+    # [limit, length, output, error]
+    state = _bytes_call.state
+    state[1] = length
+    if length > state[0]:
+        return
+    try:
+        state[2] = ctypes.string_at(data, length)
+    except BaseException as e:  # ctypes would swallow it; re-raised by the caller
+        state[3] = e
+
+
+class _Scratch(threading.local):
+    """
+    Per-thread out-parameter objects reused across FFI calls.
+
+    Out-parameters that are read and released before the call returns use
+    these instead of allocating new ctypes objects on every call. Being
+    thread-local, they stay correct when several threads call into the library
+    at once. Pointers retained past the call (document handles, views) must
+    not use them.
+    """
+
+    def __init__(self):
+        self.major = ctypes.c_int()
+        self.minor = ctypes.c_int()
+        self.msg_ptr = ctypes.c_char_p()
+        self.data_ptr = ctypes.POINTER(ctypes.c_uint8)()
+        self.data_len = ctypes.c_size_t()
+
+
+_scratch = _Scratch()
+
+
+def _make_text_conv(ffi_fn, operation: str, takes_flag: bool = False) -> Callable[..., str]:
+    """
+    Build the converter for one hedl_to_* text export.
+
+    The returned function is convert(ptr, limiter) or, with takes_flag,
+    convert(ptr, flag, limiter). The FFI function and error context are bound
+    as closure cells, so a call does no global lookups and no argument tuple
+    packing.
+
+    The size limit is checked on the raw output before decoding, so oversized
+    output is rejected without building a str.
+    """
+    ok = HEDL_OK
+    from_lib = HedlError.from_lib
+    free_string = _hedl_free_string
+    scratch = _scratch
+
+    def finish(result: int, out_ptr, limiter: ResourceLimiter) -> str:
+        if result != ok:
+            raise from_lib(result, operation)
+        raw = out_ptr.value
+        free_string(out_ptr)
+        if not raw:
+            return ""
+        limiter.check_output(len(raw), operation)
+        return raw.decode("utf-8")
+
+    if takes_flag:
+        def convert(ptr, flag: int, limiter: ResourceLimiter) -> str:
+            out_ptr = scratch.msg_ptr
+            return finish(ffi_fn(ptr, flag, out_ptr), out_ptr, limiter)
+    else:
+        def convert(ptr, limiter: ResourceLimiter) -> str:
+            out_ptr = scratch.msg_ptr
+            return finish(ffi_fn(ptr, out_ptr), out_ptr, limiter)
+    return convert
+
+
+_canonicalize_text = _make_text_conv(_hedl_canonicalize, "Canonicalize HEDL document")
+_json_text = _make_text_conv(_hedl_to_json, "Convert HEDL to JSON", takes_flag=True)
+_yaml_text = _make_text_conv(_hedl_to_yaml, "Convert HEDL to YAML", takes_flag=True)
+_xml_text = _make_text_conv(_hedl_to_xml, "Convert HEDL to XML")
+_csv_text = _make_text_conv(_hedl_to_csv, "Convert HEDL to CSV")
+_cypher_text = _make_text_conv(
+    _hedl_to_neo4j_cypher, "Convert HEDL to Neo4j Cypher", takes_flag=True
+)
+
+
+def _native_bytes_view(data_ptr, length: int) -> memoryview:
+    """
+    Wrap a byte buffer owned by the native library in a read-only memoryview.
+
+    The buffer is freed with hedl_free_bytes once the view, and every view
+    derived from it, has been released or garbage collected.
+    """
+    if length == 0:
+        return memoryview(b"")
+    address = ctypes.cast(data_ptr, ctypes.c_void_p).value
+    array = (ctypes.c_uint8 * length).from_address(address)
+    weakref.finalize(array, _hedl_free_bytes, data_ptr, length)
+    return memoryview(array).cast("B").toreadonly()
+
+
+class _DocumentHandle:
+    """
+    Reference-counted native document handle.
+
+    An uncached handle belongs to a single Document and is freed by its
+    close(). A cached handle is shared between every Document returned for
+    the same source, plus one reference held by the parse cache itself. The
+    native document is freed when the last reference is released.
+
+    Reference counts are updated under _cache_lock because Documents sharing
+    a handle may be closed from different threads.
+
+    The handle, not each Document, carries the weakref finalizer, so a cache
+    hit registers none. A Document dropped without close() never releases
+    its reference; the native document is then freed once the handle itself
+    is collected, i.e. when no Document or cache entry refers to it any more.
+    """
+
+    def __init__(self, ptr):
+        self.ptr = ptr
+        self.refs = 1
+        # Runs at most once: on the last release(), on collection, or at
+        # interpreter exit. Unlike __del__ this does not block cycle
+        # collection and does not depend on module globals at shutdown.
+        self._free = weakref.finalize(self, _hedl_free_document, ptr)
+
+    def acquire(self) -> "_DocumentHandle":
+        with _cache_lock:
+            self.refs += 1
+        return self
+
+    def release(self) -> None:
+        with _cache_lock:
+            self.refs -= 1
+            last = self.refs == 0
+        if last:
+            self._free()
+
+
+class _ParseCache:
+    """
+    LRU cache of parsed documents keyed by (SHA-256 of source, strict).
+
+    Used only by parse(..., cache=True). Parsed documents are read-only, so
+    Documents created from identical source can share one native handle
+    instead of re-parsing. Entries are bounded both in number and in total
+    source bytes. Lookups and insertions hold _cache_lock; the parse itself
+    runs outside it, so threads parsing different sources do not serialize on
+    the cache.
+    """
+
+    def __init__(self, maxsize: int, max_bytes: int):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[Tuple[bytes, bool], Tuple[_DocumentHandle, int]]" = OrderedDict()
+
+    def get(self, key: Tuple[bytes, bool]) -> Optional[_DocumentHandle]:
+        """Return a new reference to the cached handle for key, if any."""
+        with _cache_lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            handle = entry[0]
+            handle.refs += 1
+        return handle
+
+    def put(self, key: Tuple[bytes, bool], handle: _DocumentHandle, size: int) -> None:
+        """Cache handle for a source of size bytes, unless it is too large."""
+        if size > self.max_bytes:
+            return
+        evicted = []
+        with _cache_lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                evicted.append(previous[0])
+                self.total_bytes -= previous[1]
+            handle.refs += 1
+            self._entries[key] = (handle, size)
+            self.total_bytes += size
+            while len(self._entries) > self.maxsize or self.total_bytes > self.max_bytes:
+                old, old_size = self._entries.popitem(last=False)[1]
+                evicted.append(old)
+                self.total_bytes -= old_size
+        for old in evicted:
+            old.release()
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with _cache_lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self.total_bytes = 0
+        for handle, _ in entries:
+            handle.release()
+
+
+_cache_lock = threading.Lock()
+_parse_cache = _ParseCache(PARSE_CACHE_SIZE, PARSE_CACHE_MAX_BYTES)
+
+
+def clear_parse_cache() -> None:
+    """Release all documents held by the parse(..., cache=True) cache."""
+    _parse_cache.clear()
+
+
 class Diagnostics:
     """
     Lint diagnostics container.
@@ -177,10 +536,16 @@ class Diagnostics:
         ...         print(f"[{severity}] {msg}")
     """
 
+    # __weakref__ is required by weakref.finalize.
+    __slots__ = ("_ptr", "_items", "_finalizer", "__weakref__")
+
     def __init__(self, ptr):
-        self._lib = load_library()
+        # Set to None on close(); doubles as the closed flag.
         self._ptr = ptr
-        self._closed = False
+        self._items: Optional[List[Tuple[str, int]]] = None
+        # Frees the handle if the object is collected (or at interpreter exit)
+        # without close(); unlike __del__ this does not block cycle collection.
+        self._finalizer = weakref.finalize(self, _hedl_free_diagnostics, ptr)
 
     def __enter__(self):
         return self
@@ -191,24 +556,24 @@ class Diagnostics:
 
     def close(self) -> None:
         """Free the diagnostics handle."""
-        if not self._closed and self._ptr:
-            self._lib.hedl_free_diagnostics(self._ptr)
-            self._closed = True
-
-    def __del__(self):
-        self.close()
+        if self._ptr is not None:
+            self._finalizer()
+            self._ptr = None
+            self._items = None
 
     def __len__(self) -> int:
         """Return the number of diagnostics."""
-        if self._closed:
+        ptr = self._ptr
+        if ptr is None:
             return 0
-        count = self._lib.hedl_diagnostics_count(self._ptr)
-        return max(0, count)
+        count = _hedl_diagnostics_count(ptr)
+        if count < 0:
+            raise HedlError.from_lib(count, "Count diagnostics")
+        return count
 
     def __iter__(self):
         """Iterate over (message, severity) tuples."""
-        for i in range(len(self)):
-            yield self.get(i)
+        return iter(self._all())
 
     def get(self, index: int) -> Tuple[str, int]:
         """
@@ -224,7 +589,7 @@ class Diagnostics:
             IndexError: If index is out of range.
             HedlError: If retrieval fails.
         """
-        if self._closed:
+        if self._ptr is None:
             raise HedlError(
                 format_resource_error(
                     "Access diagnostics",
@@ -234,37 +599,71 @@ class Diagnostics:
                 HEDL_ERR_NULL_PTR
             )
 
-        if index < 0 or index >= len(self):
+        items = self._items
+        count = len(items) if items is not None else len(self)
+        if index < 0 or index >= count:
             raise IndexError(f"Diagnostic index {index} out of range")
 
-        msg_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_diagnostics_get(
-            self._ptr, index, ctypes.byref(msg_ptr)
+        if items is not None:
+            return items[index]
+        return self._get_unchecked(index)
+
+    def _get_unchecked(self, index: int) -> Tuple[str, int]:
+        """Fetch diagnostic at index; the caller guarantees it is in range."""
+        msg_ptr = _scratch.msg_ptr
+        result = _hedl_diagnostics_get(
+            self._ptr, index, msg_ptr
         )
 
         if result != HEDL_OK:
             raise HedlError.from_lib(result, "Get diagnostic message", f"index {index}")
 
         message = msg_ptr.value.decode("utf-8") if msg_ptr.value else ""
-        self._lib.hedl_free_string(msg_ptr)
+        _hedl_free_string(msg_ptr)
 
-        severity = self._lib.hedl_diagnostics_severity(self._ptr, index)
+        severity = _hedl_diagnostics_severity(self._ptr, index)
         return (message, severity)
 
+    def _fetch_all(self) -> List[Tuple[str, int]]:
+        """Fetch every (message, severity) pair in one pass over the handle."""
+        ptr = self._ptr
+        get_message = _hedl_diagnostics_get
+        get_severity = _hedl_diagnostics_severity
+        free_string = _hedl_free_string
+        msg_ptr = _scratch.msg_ptr
+
+        items = []
+        for index in range(len(self)):
+            result = get_message(ptr, index, msg_ptr)
+            if result != HEDL_OK:
+                raise HedlError.from_lib(result, "Get diagnostic message", f"index {index}")
+            raw = msg_ptr.value
+            free_string(msg_ptr)
+            items.append((raw.decode("utf-8") if raw else "", get_severity(ptr, index)))
+        return items
+
+    def _all(self) -> List[Tuple[str, int]]:
+        """Fetch every diagnostic once and keep the list for later lookups."""
+        if self._items is None:
+            if self._ptr is None:
+                return []
+            self._items = self._fetch_all()
+        return self._items
+
     @property
     def errors(self) -> List[str]:
         """Get all error messages."""
-        return [msg for msg, sev in self if sev == SEVERITY_ERROR]
+        return [msg for msg, sev in self._all() if sev == SEVERITY_ERROR]
 
     @property
     def warnings(self) -> List[str]:
         """Get all warning messages."""
-        return [msg for msg, sev in self if sev == SEVERITY_WARNING]
+        return [msg for msg, sev in self._all() if sev == SEVERITY_WARNING]
 
     @property
     def hints(self) -> List[str]:
         """Get all hint messages."""
-        return [msg for msg, sev in self if sev == SEVERITY_HINT]
+        return [msg for msg, sev in self._all() if sev == SEVERITY_HINT]
 
 
 class Document:
@@ -287,29 +686,63 @@ class Document:
         ...     parquet_bytes = doc.to_parquet()
     """
 
-    def __init__(self, ptr):
-        self._lib = load_library()
+    # __weakref__ keeps Documents weakly referenceable.
+    __slots__ = ("_handle", "_limiter", "_ptr", "__weakref__")
+
+    def __init__(self, ptr, handle: Optional[_DocumentHandle] = None,
+                 limiter: Optional[ResourceLimiter] = None):
+        self._handle = handle if handle is not None else _DocumentHandle(ptr)
+        self._limiter = limiter if limiter is not None else DEFAULT_LIMITER
+        # Set to None on close(); doubles as the closed flag. A Document
+        # collected without close() is cleaned up by the handle's finalizer.
         self._ptr = ptr
-        self._closed = False
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        # Inlined close() to keep with-blocks to a single Python call on exit.
+        if self._ptr is not None:
+            self._handle.release()
+            self._ptr = None
         return False
 
     def close(self) -> None:
-        """Free the document handle."""
-        if not self._closed and self._ptr:
-            self._lib.hedl_free_document(self._ptr)
-            self._closed = True
+        """Release the document handle (freed now unless it is cached)."""
+        if self._ptr is not None:
+            self._handle.release()
+            self._ptr = None
 
-    def __del__(self):
-        self.close()
+    def reparse(self, content: Union[str, bytes], strict: bool = True,
+                cache: bool = False) -> None:
+        """
+        Replace this document's contents by parsing new HEDL content.
+
+        Lets callers recycle one Document object across many parses instead of
+        creating and closing a new one each time. Only the Python object is
+        reused: the content is parsed into a new native document, which then
+        replaces the old one. Works on closed documents too. If parsing fails,
+        the document is left unchanged.
+
+        Args:
+            content: HEDL content as string or bytes.
+            strict: Enable strict reference validation.
+            cache: Look up and store the result in the parse cache.
+
+        Raises:
+            HedlError: If parsing fails.
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        handle = _parse_handle(content, strict, self._limiter, cache)
+        # Release the previous handle, unless the document was closed.
+        if self._ptr is not None:
+            self._handle.release()
+        self._handle = handle
+        self._ptr = handle.ptr
 
     def _check_closed(self) -> None:
-        if self._closed:
+        if self._ptr is None:
             raise HedlError(
                 format_resource_error(
                     "Access document",
@@ -329,10 +762,11 @@ class Document:
             (1, 0)
         """
         self._check_closed()
-        major = ctypes.c_int()
-        minor = ctypes.c_int()
-        result = self._lib.hedl_get_version(
-            self._ptr, ctypes.byref(major), ctypes.byref(minor)
+        scratch = _scratch
+        major = scratch.major
+        minor = scratch.minor
+        result = _hedl_get_version(
+            self._ptr, major, minor
         )
         if result != HEDL_OK:
             raise HedlError.from_lib(result, "Get HEDL version")
@@ -342,7 +776,7 @@ class Document:
     def schema_count(self) -> int:
         """Get the number of schema definitions."""
         self._check_closed()
-        count = self._lib.hedl_schema_count(self._ptr)
+        count = _hedl_schema_count(self._ptr)
         if count < 0:
             raise HedlError.from_lib(count, "Get schema count")
         return count
@@ -351,7 +785,7 @@ class Document:
     def alias_count(self) -> int:
         """Get the number of alias definitions."""
         self._check_closed()
-        count = self._lib.hedl_alias_count(self._ptr)
+        count = _hedl_alias_count(self._ptr)
         if count < 0:
             raise HedlError.from_lib(count, "Get alias count")
         return count
@@ -360,7 +794,7 @@ class Document:
     def root_item_count(self) -> int:
         """Get the number of root items."""
         self._check_closed()
-        count = self._lib.hedl_root_item_count(self._ptr)
+        count = _hedl_root_item_count(self._ptr)
         if count < 0:
             raise HedlError.from_lib(count, "Get root item count")
         return count
@@ -376,14 +810,7 @@ class Document:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
-        out_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_canonicalize(self._ptr, ctypes.byref(out_ptr))
-        if result != HEDL_OK:
-            raise HedlError.from_lib(result, "Canonicalize HEDL document")
-        output = out_ptr.value.decode("utf-8") if out_ptr.value else ""
-        self._lib.hedl_free_string(out_ptr)
-        _check_output_size(output, "Canonicalize HEDL document")
-        return output
+        return _canonicalize_text(self._ptr, self._limiter)
 
     def to_json(self, include_metadata: bool = False, pretty: bool = True) -> str:
         """
@@ -400,16 +827,93 @@ class Document:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
-        out_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_to_json(
-            self._ptr, 1 if include_metadata else 0, ctypes.byref(out_ptr)
-        )
+        return _json_text(self._ptr, 1 if include_metadata else 0, self._limiter)
+
+    def to_json_into(self, buf: bytearray, include_metadata: bool = False) -> int:
+        """
+        Write JSON as UTF-8 bytes into a caller-supplied buffer.
+
+        The output is copied straight from the native serializer into `buf`,
+        so reusing one buffer across calls avoids allocating a new str each
+        time.
+
+        Args:
+            buf: Writable buffer receiving the output; must be large enough.
+            include_metadata: Include __type__ and __schema__ fields.
+
+        Returns:
+            Number of bytes written to the start of `buf`.
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE or len(buf).
+        """
+        self._check_closed()
+        capacity = len(buf)
+        # A single c_char exported at the start of buf pins it and gives
+        # memmove its address, without building a c_char * capacity type
+        if capacity:
+            export = ctypes.c_char.from_buffer(buf)
+            state = [export, ctypes.addressof(export), capacity, 0]
+            del export
+        else:
+            state = [None, None, 0, 0]
+        _bytes_call.state = state
+        try:
+            result = _hedl_to_json_callback(
+                self._ptr, 1 if include_metadata else 0, _into_sink, None
+            )
+        finally:
+            _bytes_call.state = None
+            # Drop the export so buf can be resized again
+            state[0] = None
         if result != HEDL_OK:
             raise HedlError.from_lib(result, "Convert HEDL to JSON")
-        output = out_ptr.value.decode("utf-8") if out_ptr.value else ""
-        self._lib.hedl_free_string(out_ptr)
-        _check_output_size(output, "Convert HEDL to JSON")
-        return output
+
+        length = state[3]
+        self._limiter.check_output(length, "Convert HEDL to JSON")
+        if length > capacity:
+            raise HedlError(
+                format_resource_error(
+                    "Convert HEDL to JSON",
+                    f"Output size ({length} bytes) exceeds buffer size ({capacity} bytes)",
+                    "Buffer large enough for the serialized document"
+                ),
+                HEDL_ERR_ALLOC
+            )
+        return length
+
+    def to_json_view(self, include_metadata: bool = False) -> memoryview:
+        """
+        Convert to JSON as UTF-8 bytes, without decoding to str.
+
+        The serializer output is copied once into a Python buffer; callers
+        that only write the JSON out (to a file or socket) skip the str
+        decode and the re-encode on the way out.
+
+        Args:
+            include_metadata: Include __type__ and __schema__ fields.
+
+        Returns:
+            Read-only memoryview of the UTF-8 encoded JSON.
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
+        """
+        self._check_closed()
+        state = [self._limiter.max_output_size, 0, b"", None]
+        _bytes_call.state = state
+        try:
+            result = _hedl_to_json_callback(
+                self._ptr, 1 if include_metadata else 0, _view_sink, None
+            )
+        finally:
+            _bytes_call.state = None
+        if result != HEDL_OK:
+            raise HedlError.from_lib(result, "Convert HEDL to JSON")
+        if state[3] is not None:
+            raise state[3]
+        self._limiter.check_output(state[1], "Convert HEDL to JSON")
+        return memoryview(state[2])
 
     def to_yaml(self, include_metadata: bool = False) -> str:
         """
@@ -425,16 +929,7 @@ class Document:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
-        out_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_to_yaml(
-            self._ptr, 1 if include_metadata else 0, ctypes.byref(out_ptr)
-        )
-        if result != HEDL_OK:
-            raise HedlError.from_lib(result, "Convert HEDL to YAML")
-        output = out_ptr.value.decode("utf-8") if out_ptr.value else ""
-        self._lib.hedl_free_string(out_ptr)
-        _check_output_size(output, "Convert HEDL to YAML")
-        return output
+        return _yaml_text(self._ptr, 1 if include_metadata else 0, self._limiter)
 
     def to_xml(self) -> str:
         """
@@ -447,14 +942,7 @@ class Document:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
-        out_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_to_xml(self._ptr, ctypes.byref(out_ptr))
-        if result != HEDL_OK:
-            raise HedlError.from_lib(result, "Convert HEDL to XML")
-        output = out_ptr.value.decode("utf-8") if out_ptr.value else ""
-        self._lib.hedl_free_string(out_ptr)
-        _check_output_size(output, "Convert HEDL to XML")
-        return output
+        return _xml_text(self._ptr, self._limiter)
 
     def to_csv(self) -> str:
         """
@@ -469,14 +957,7 @@ class Document:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
-        out_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_to_csv(self._ptr, ctypes.byref(out_ptr))
-        if result != HEDL_OK:
-            raise HedlError.from_lib(result, "Convert HEDL to CSV")
-        output = out_ptr.value.decode("utf-8") if out_ptr.value else ""
-        self._lib.hedl_free_string(out_ptr)
-        _check_output_size(output, "Convert HEDL to CSV")
-        return output
+        return _csv_text(self._ptr, self._limiter)
 
     def to_parquet(self) -> bytes:
         """
@@ -487,23 +968,81 @@ class Document:
         Returns:
             Parquet file contents as bytes.
 
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
+        """
+        self._check_closed()
+        scratch = _scratch
+        data_ptr = scratch.data_ptr
+        data_len = scratch.data_len
+        result = _hedl_to_parquet(
+            self._ptr, data_ptr, data_len
+        )
+        if result != HEDL_OK:
+            raise HedlError.from_lib(result, "Convert HEDL to Parquet")
+
+        # Copy bytes before freeing (one memcpy, no per-byte indexing)
+        length = data_len.value
+        output = ctypes.string_at(data_ptr, length)
+        _hedl_free_bytes(data_ptr, length)
+        self._limiter.check_output(length, "Convert HEDL to Parquet")
+        return output
+
+    def to_parquet_view(self) -> memoryview:
+        """
+        Convert to Parquet format without copying the output.
+
+        Note: Only works for documents with matrix lists.
+
+        Returns:
+            Read-only memoryview over the native output buffer. The buffer is
+            freed once the view is released (or garbage collected), so large
+            outputs can be written or handed to pyarrow without a copy.
+
         Raises:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
         data_ptr = ctypes.POINTER(ctypes.c_uint8)()
         data_len = ctypes.c_size_t()
-        result = self._lib.hedl_to_parquet(
-            self._ptr, ctypes.byref(data_ptr), ctypes.byref(data_len)
+        result = _hedl_to_parquet(
+            self._ptr, data_ptr, data_len
         )
         if result != HEDL_OK:
             raise HedlError.from_lib(result, "Convert HEDL to Parquet")
 
-        # Copy bytes before freeing
-        output = bytes(data_ptr[:data_len.value])
-        self._lib.hedl_free_bytes(data_ptr, data_len)
-        _check_output_size(output, "Convert HEDL to Parquet")
-        return output
+        view = _native_bytes_view(data_ptr, data_len.value)
+        try:
+            self._limiter.check_output(view.nbytes, "Convert HEDL to Parquet")
+        except HedlError:
+            view.release()
+            raise
+        return view
+
+    def write_parquet(self, fileobj) -> int:
+        """
+        Write the document in Parquet format to a binary file object.
+
+        The native output buffer is handed to fileobj.write() directly and
+        freed afterwards, so no Python copy of the Parquet data is made.
+
+        Note: Only works for documents with matrix lists.
+
+        Args:
+            fileobj: Binary file-like object with a write() method.
+
+        Returns:
+            Number of bytes of Parquet data.
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
+        """
+        view = self.to_parquet_view()
+        try:
+            fileobj.write(view)
+            return view.nbytes
+        finally:
+            view.release()
 
     def to_cypher(self, use_merge: bool = True) -> str:
         """
@@ -519,16 +1058,7 @@ class Document:
             HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit.
         """
         self._check_closed()
-        out_ptr = ctypes.c_char_p()
-        result = self._lib.hedl_to_neo4j_cypher(
-            self._ptr, 1 if use_merge else 0, ctypes.byref(out_ptr)
-        )
-        if result != HEDL_OK:
-            raise HedlError.from_lib(result, "Convert HEDL to Neo4j Cypher")
-        output = out_ptr.value.decode("utf-8") if out_ptr.value else ""
-        self._lib.hedl_free_string(out_ptr)
-        _check_output_size(output, "Convert HEDL to Neo4j Cypher")
-        return output
+        return _cypher_text(self._ptr, 1 if use_merge else 0, self._limiter)
 
     def lint(self) -> Diagnostics:
         """
@@ -543,47 +1073,182 @@ class Document:
             ...         print(msg)
         """
         self._check_closed()
-        diag_ptr = self._lib.HedlDiagnosticsPtr()
-        result = self._lib.hedl_lint(self._ptr, ctypes.byref(diag_ptr))
+        diag_ptr = _HedlDiagnosticsPtr()
+        result = _hedl_lint(self._ptr, diag_ptr)
         if result != HEDL_OK:
             raise HedlError.from_lib(result, "Lint HEDL document")
         return Diagnostics(diag_ptr)
 
 
-def parse(content: Union[str, bytes], strict: bool = True) -> Document:
+def parse(content: Union[str, bytes], strict: bool = True,
+          limiter: Optional[ResourceLimiter] = None, cache: bool = False) -> Document:
     """
     Parse HEDL content into a Document.
 
+    By default every call parses its input into its own native document,
+    which close() frees.
+
+    With cache=True, results are cached by the SHA-256 of the source (up to
+    PARSE_CACHE_SIZE documents and PARSE_CACHE_MAX_BYTES of source). Parsing
+    identical content again with cache=True returns a new Document sharing the
+    already-parsed native handle. Such Documents are independent Python
+    objects but read the same native document, so they must not be used from
+    several threads at once. Their close() releases a reference; the native
+    document is freed once it is also evicted or clear_parse_cache() is called.
+
     Args:
         content: HEDL content as string or bytes.
         strict: Enable strict reference validation.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+        cache: Look up and store the result in the parse cache.
 
     Returns:
         Parsed Document object.
 
     Raises:
-        HedlError: If parsing fails.
+        HedlError: If parsing fails or the input exceeds the limiter's limit.
 
     Example:
         >>> doc = hedl.parse('%VERSION: 1.0\\n---\\nkey: value')
         >>> print(doc.version)
         (1, 0)
     """
-    lib = load_library()
-
     if isinstance(content, str):
         content = content.encode("utf-8")
+    return parse_bytes(content, strict, limiter, cache)
+
+
+def parse_bytes(content: bytes, strict: bool = True,
+                limiter: Optional[ResourceLimiter] = None, cache: bool = False) -> Document:
+    """
+    Parse UTF-8 encoded HEDL content into a Document.
+
+    Same as parse(), minus the str check and encode, for callers that already
+    hold bytes (file reads, network buffers).
+
+    Args:
+        content: HEDL content as UTF-8 bytes.
+        strict: Enable strict reference validation.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+        cache: Look up and store the result in the parse cache.
+
+    Returns:
+        Parsed Document object.
 
-    doc_ptr = lib.HedlDocumentPtr()
-    result = lib.hedl_parse(
-        content, len(content), 1 if strict else 0, ctypes.byref(doc_ptr)
+    Raises:
+        HedlError: If parsing fails or the input exceeds the limiter's limit.
+    """
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    handle = _parse_handle(content, strict, limiter, cache)
+    return Document(handle.ptr, handle, limiter)
+
+
+def _parse_handle(content: bytes, strict: bool, limiter: ResourceLimiter,
+                  cache: bool = False) -> _DocumentHandle:
+    """Parse content, through the cache if asked, returning a handle owned by the caller."""
+    limiter.check_input(len(content), "Parse HEDL document")
+    _check_ffi_input_len(len(content), "Parse HEDL document")
+
+    if cache:
+        key = (hashlib.sha256(content).digest(), bool(strict))
+        handle = _parse_cache.get(key)
+        if handle is not None:
+            return handle
+
+    doc_ptr = _HedlDocumentPtr()
+    result = _hedl_parse(
+        content, len(content), 1 if strict else 0, doc_ptr
     )
 
     if result != HEDL_OK:
         input_info = f"{len(content)} bytes"
         raise HedlError.from_lib(result, "Parse HEDL document", input_info)
 
-    return Document(doc_ptr)
+    handle = _DocumentHandle(doc_ptr)
+    if cache:
+        _parse_cache.put(key, handle, len(content))
+    return handle
+
+
+def parse_many(contents: Iterable[Union[str, bytes]], strict: bool = True,
+               limiter: Optional[ResourceLimiter] = None, cache: bool = False) -> List[Document]:
+    """
+    Parse a batch of HEDL documents.
+
+    Equivalent to calling parse() on each item, but runs the whole batch in a
+    single call. If any item fails to parse, the Documents already created are
+    closed before the error is raised.
+
+    Args:
+        contents: Iterable of HEDL contents as strings or bytes.
+        strict: Enable strict reference validation.
+        limiter: Size limits for every document (default: DEFAULT_LIMITER).
+        cache: Look up and store each result in the parse cache.
+
+    Returns:
+        List of parsed Document objects, in input order.
+
+    Raises:
+        HedlError: If any item fails to parse.
+
+    Example:
+        >>> docs = hedl.parse_many([config_a, config_b])
+        >>> [doc.version for doc in docs]
+        [(1, 0), (1, 0)]
+    """
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    docs: List[Document] = []
+    # Resolve the defaults and globals once; the loop then only touches locals.
+    append = docs.append
+    parse_handle = _parse_handle
+    document = Document
+    try:
+        for content in contents:
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            handle = parse_handle(content, strict, limiter, cache)
+            append(document(handle.ptr, handle, limiter))
+    except BaseException:
+        for doc in docs:
+            doc.close()
+        raise
+    return docs
+
+
+def parse_and_lint(content: Union[str, bytes], strict: bool = True,
+                   limiter: Optional[ResourceLimiter] = None,
+                   cache: bool = False) -> Tuple[Document, Diagnostics]:
+    """
+    Parse HEDL content and lint the resulting document.
+
+    Equivalent to parse() followed by Document.lint(), for callers that would
+    otherwise validate() first and then parse the same source again.
+
+    Args:
+        content: HEDL content as string or bytes.
+        strict: Enable strict reference validation.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+        cache: Look up and store the result in the parse cache.
+
+    Returns:
+        Tuple of (Document, Diagnostics); both should be closed by the caller.
+
+    Raises:
+        HedlError: If parsing or linting fails.
+
+    Example:
+        >>> doc, diag = hedl.parse_and_lint(content)
+        >>> with doc, diag:
+        ...     print(len(diag.errors))
+    """
+    doc = parse(content, strict, limiter, cache)
+    try:
+        return doc, doc.lint()
+    except BaseException:
+        doc.close()
+        raise
 
 
 def validate(content: Union[str, bytes], strict: bool = True) -> bool:
@@ -597,27 +1262,154 @@ def validate(content: Union[str, bytes], strict: bool = True) -> bool:
     Returns:
         True if valid, False otherwise.
 
+    Raises:
+        HedlError: If the input is too long to pass to the library.
+
     Example:
         >>> hedl.validate('%VERSION: 1.0\\n---\\nkey: value')
         True
         >>> hedl.validate('invalid content')
         False
     """
-    lib = load_library()
-
     if isinstance(content, str):
         content = content.encode("utf-8")
+    elif not isinstance(content, bytes):
+        content = bytes(content)
+
+    _check_ffi_input_len(len(content), "Validate HEDL document")
+    return _hedl_validate(content, len(content), 1 if strict else 0) == HEDL_OK
+
+
+def validate_bytes(content: bytes, strict: bool = True) -> bool:
+    """
+    Validate UTF-8 encoded HEDL content without creating a document.
+
+    Same as validate(), minus the input type checks, for callers that already
+    hold bytes.
+
+    Args:
+        content: HEDL content as UTF-8 bytes.
+        strict: Enable strict reference validation.
+
+    Returns:
+        True if valid, False otherwise.
 
-    result = lib.hedl_validate(content, len(content), 1 if strict else 0)
+    Raises:
+        HedlError: If the input is too long to pass to the library.
+    """
+    _check_ffi_input_len(len(content), "Validate HEDL document")
+    return _hedl_validate(content, len(content), 1 if strict else 0) == HEDL_OK
+
+
+def _call_with_mapped_file(path: Union[str, "os.PathLike[str]"], fn: Callable[[Any, int], int],
+                           operation: str,
+                           check_size: Optional[Callable[[int], None]] = None) -> Tuple[int, int]:
+    """
+    Call fn(data, size) with the contents of a file mapped into memory.
+
+    The file is mapped copy-on-write, so the FFI reads the page cache directly
+    and no Python copy of the contents is made. Before mapping, the file size
+    is checked against the FFI input length limit and passed to check_size,
+    if given.
+
+    fn must only make the FFI call and return its result code. It must not
+    raise or keep a reference to data: a traceback or reference still holding
+    the buffer would stop the mapping from closing. Callers raise on the
+    returned code once the mapping is gone.
+
+    Returns:
+        Tuple of (fn result, file size).
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        _check_ffi_input_len(size, operation)
+        if check_size is not None:
+            check_size(size)
+        if size == 0:
+            return fn(b"", 0), 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) as mm:
+            data = (ctypes.c_char * size).from_buffer(mm)
+            try:
+                result = fn(data, size)
+            finally:
+                del data
+    return result, size
+
+
+def parse_file(path: Union[str, "os.PathLike[str]"], strict: bool = True,
+               limiter: Optional[ResourceLimiter] = None) -> Document:
+    """
+    Parse a HEDL file into a Document.
+
+    The file is memory-mapped and handed to the parser directly, so large
+    files are never read into a Python bytes object. Unlike parse(), results
+    are not cached.
+
+    Args:
+        path: Path to the HEDL file.
+        strict: Enable strict reference validation.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+
+    Returns:
+        Parsed Document object.
+
+    Raises:
+        HedlError: If parsing fails.
+        OSError: If the file cannot be opened.
+
+    Example:
+        >>> with hedl.parse_file("config.hedl") as doc:
+        ...     print(doc.version)
+    """
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    flag = 1 if strict else 0
+    doc_ptr = _HedlDocumentPtr()
+
+    result, size = _call_with_mapped_file(
+        path,
+        lambda data, size: _hedl_parse(data, size, flag, doc_ptr),
+        "Parse HEDL document",
+        lambda size: limiter.check_input(size, "Parse HEDL document"),
+    )
+    if result != HEDL_OK:
+        input_info = f"{os.fspath(path)}, {size} bytes"
+        raise HedlError.from_lib(result, "Parse HEDL document", input_info)
+    return Document(doc_ptr, limiter=limiter)
+
+
+def validate_file(path: Union[str, "os.PathLike[str]"], strict: bool = True) -> bool:
+    """
+    Validate a HEDL file without creating a document.
+
+    The file is memory-mapped and handed to the validator directly, so memory
+    use does not grow with a Python copy of the file.
+
+    Args:
+        path: Path to the HEDL file.
+        strict: Enable strict reference validation.
+
+    Returns:
+        True if valid, False otherwise.
+
+    Raises:
+        HedlError: If the file is too large to pass to the library.
+        OSError: If the file cannot be opened.
+    """
+    flag = 1 if strict else 0
+    result, _ = _call_with_mapped_file(
+        path, lambda data, size: _hedl_validate(data, size, flag), "Validate HEDL document"
+    )
     return result == HEDL_OK
 
 
-def from_json(content: Union[str, bytes]) -> Document:
+def from_json(content: Union[str, bytes], limiter: Optional[ResourceLimiter] = None) -> Document:
     """
     Parse JSON content into a HEDL Document.
 
     Args:
         content: JSON content as string or bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
 
     Returns:
         Parsed Document object.
@@ -629,27 +1421,49 @@ def from_json(content: Union[str, bytes]) -> Document:
         >>> doc = hedl.from_json('{"key": "value"}')
         >>> print(doc.to_json())
     """
-    lib = load_library()
-
     if isinstance(content, str):
         content = content.encode("utf-8")
+    return from_json_bytes(content, limiter)
+
+
+def from_json_bytes(content: bytes, limiter: Optional[ResourceLimiter] = None) -> Document:
+    """
+    Parse UTF-8 encoded JSON content into a HEDL Document.
 
-    doc_ptr = lib.HedlDocumentPtr()
-    result = lib.hedl_from_json(content, len(content), ctypes.byref(doc_ptr))
+    Same as from_json(), minus the str check and encode.
+
+    Args:
+        content: JSON content as UTF-8 bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+
+    Returns:
+        Parsed Document object.
+
+    Raises:
+        HedlError: If parsing fails.
+    """
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    limiter.check_input(len(content), "Parse JSON to HEDL")
+    _check_ffi_input_len(len(content), "Parse JSON to HEDL")
+
+    doc_ptr = _HedlDocumentPtr()
+    result = _hedl_from_json(content, len(content), doc_ptr)
 
     if result != HEDL_OK:
         input_info = f"{len(content)} bytes of JSON"
         raise HedlError.from_lib(result, "Parse JSON to HEDL", input_info)
 
-    return Document(doc_ptr)
+    return Document(doc_ptr, limiter=limiter)
 
 
-def from_yaml(content: Union[str, bytes]) -> Document:
+def from_yaml(content: Union[str, bytes], limiter: Optional[ResourceLimiter] = None) -> Document:
     """
     Parse YAML content into a HEDL Document.
 
     Args:
         content: YAML content as string or bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
 
     Returns:
         Parsed Document object.
@@ -657,27 +1471,49 @@ def from_yaml(content: Union[str, bytes]) -> Document:
     Raises:
         HedlError: If parsing fails.
     """
-    lib = load_library()
-
     if isinstance(content, str):
         content = content.encode("utf-8")
+    return from_yaml_bytes(content, limiter)
+
+
+def from_yaml_bytes(content: bytes, limiter: Optional[ResourceLimiter] = None) -> Document:
+    """
+    Parse UTF-8 encoded YAML content into a HEDL Document.
+
+    Same as from_yaml(), minus the str check and encode.
 
-    doc_ptr = lib.HedlDocumentPtr()
-    result = lib.hedl_from_yaml(content, len(content), ctypes.byref(doc_ptr))
+    Args:
+        content: YAML content as UTF-8 bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+
+    Returns:
+        Parsed Document object.
+
+    Raises:
+        HedlError: If parsing fails.
+    """
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    limiter.check_input(len(content), "Parse YAML to HEDL")
+    _check_ffi_input_len(len(content), "Parse YAML to HEDL")
+
+    doc_ptr = _HedlDocumentPtr()
+    result = _hedl_from_yaml(content, len(content), doc_ptr)
 
     if result != HEDL_OK:
         input_info = f"{len(content)} bytes of YAML"
         raise HedlError.from_lib(result, "Parse YAML to HEDL", input_info)
 
-    return Document(doc_ptr)
+    return Document(doc_ptr, limiter=limiter)
 
 
-def from_xml(content: Union[str, bytes]) -> Document:
+def from_xml(content: Union[str, bytes], limiter: Optional[ResourceLimiter] = None) -> Document:
     """
     Parse XML content into a HEDL Document.
 
     Args:
         content: XML content as string or bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
 
     Returns:
         Parsed Document object.
@@ -685,27 +1521,49 @@ def from_xml(content: Union[str, bytes]) -> Document:
     Raises:
         HedlError: If parsing fails.
     """
-    lib = load_library()
-
     if isinstance(content, str):
         content = content.encode("utf-8")
+    return from_xml_bytes(content, limiter)
 
-    doc_ptr = lib.HedlDocumentPtr()
-    result = lib.hedl_from_xml(content, len(content), ctypes.byref(doc_ptr))
+
+def from_xml_bytes(content: bytes, limiter: Optional[ResourceLimiter] = None) -> Document:
+    """
+    Parse UTF-8 encoded XML content into a HEDL Document.
+
+    Same as from_xml(), minus the str check and encode.
+
+    Args:
+        content: XML content as UTF-8 bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
+
+    Returns:
+        Parsed Document object.
+
+    Raises:
+        HedlError: If parsing fails.
+    """
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    limiter.check_input(len(content), "Parse XML to HEDL")
+    _check_ffi_input_len(len(content), "Parse XML to HEDL")
+
+    doc_ptr = _HedlDocumentPtr()
+    result = _hedl_from_xml(content, len(content), doc_ptr)
 
     if result != HEDL_OK:
         input_info = f"{len(content)} bytes of XML"
         raise HedlError.from_lib(result, "Parse XML to HEDL", input_info)
 
-    return Document(doc_ptr)
+    return Document(doc_ptr, limiter=limiter)
 
 
-def from_parquet(content: bytes) -> Document:
+def from_parquet(content: bytes, limiter: Optional[ResourceLimiter] = None) -> Document:
     """
     Parse Parquet content into a HEDL Document.
 
     Args:
         content: Parquet file contents as bytes.
+        limiter: Size limits for the document (default: DEFAULT_LIMITER).
 
     Returns:
         Parsed Document object.
@@ -713,16 +1571,18 @@ def from_parquet(content: bytes) -> Document:
     Raises:
         HedlError: If parsing fails.
     """
-    lib = load_library()
-
-    # Create a ctypes array from bytes
-    data_array = (ctypes.c_uint8 * len(content))(*content)
+    if limiter is None:
+        limiter = DEFAULT_LIMITER
+    # bytes are passed to the FFI by pointer; other buffers are copied once
+    if not isinstance(content, bytes):
+        content = bytes(content)
+    limiter.check_input(len(content), "Parse Parquet to HEDL")
 
-    doc_ptr = lib.HedlDocumentPtr()
-    result = lib.hedl_from_parquet(data_array, len(content), ctypes.byref(doc_ptr))
+    doc_ptr = _HedlDocumentPtr()
+    result = _hedl_from_parquet(content, len(content), doc_ptr)
 
     if result != HEDL_OK:
         input_info = f"{len(content)} bytes of Parquet data"
         raise HedlError.from_lib(result, "Parse Parquet to HEDL", input_info)
 
-    return Document(doc_ptr)
+    return Document(doc_ptr, limiter=limiter)
@@ -5,8 +5,9 @@ Provides comprehensive type annotations for all HEDL operations including
 parsing, validation, conversion, and diagnostics.
 """
 
-import ctypes
-from typing import Optional, Union, Iterator, Any
+import os
+import weakref
+from typing import Optional, Union, Iterable, Iterator, Any
 from types import TracebackType
 
 # Error codes
@@ -32,6 +33,57 @@ SEVERITY_ERROR: int
 # Resource limits
 MAX_OUTPUT_SIZE: int
 
+# Bounds of the opt-in parse(..., cache=True) cache
+PARSE_CACHE_SIZE: int
+PARSE_CACHE_MAX_BYTES: int
+
+class ResourceLimiter:
+    """
+    Size limits applied to the operations of a Document.
+
+    Attributes:
+        max_output_size: Maximum conversion output size in bytes
+        max_input_size: Maximum input size in bytes, or None for no limit
+    """
+
+    max_output_size: int
+    max_input_size: Optional[int]
+
+    def __init__(
+        self,
+        max_output_size: Optional[int] = None,
+        max_input_size: Optional[int] = None
+    ) -> None:
+        """
+        Create a limiter.
+
+        Args:
+            max_output_size: Output limit in bytes (default: MAX_OUTPUT_SIZE)
+            max_input_size: Input limit in bytes (default: no limit)
+        """
+        ...
+
+    def check_output(self, output_size: int, operation: str) -> None:
+        """
+        Check an output size in bytes against max_output_size.
+
+        Raises:
+            HedlError: If output exceeds size limit
+        """
+        ...
+
+    def check_input(self, input_size: int, operation: str) -> None:
+        """
+        Check an input size in bytes against max_input_size.
+
+        Raises:
+            HedlError: If input exceeds size limit
+        """
+        ...
+
+# Limiter used by Documents created without an explicit one
+DEFAULT_LIMITER: ResourceLimiter
+
 class HedlError(Exception):
     """
     Exception raised for HEDL operations.
@@ -93,9 +145,9 @@ class Diagnostics:
         ...     warnings = diag.warnings
     """
 
-    _lib: ctypes.CDLL
-    _ptr: Any
-    _closed: bool
+    _ptr: Optional[Any]
+    _finalizer: weakref.finalize
+    _items: Optional[list[tuple[str, int]]]
 
     def __init__(self, ptr: Any) -> None: ...
 
@@ -112,8 +164,6 @@ class Diagnostics:
         """Free the diagnostics handle."""
         ...
 
-    def __del__(self) -> None: ...
-
     def __len__(self) -> int:
         """Return the number of diagnostics."""
         ...
@@ -173,11 +223,15 @@ class Document:
         ...     parquet_bytes = doc.to_parquet()
     """
 
-    _lib: ctypes.CDLL
-    _ptr: Any
-    _closed: bool
+    _ptr: Optional[Any]
+    _limiter: ResourceLimiter
 
-    def __init__(self, ptr: Any) -> None: ...
+    def __init__(
+        self,
+        ptr: Any,
+        handle: Optional[Any] = None,
+        limiter: Optional[ResourceLimiter] = None
+    ) -> None: ...
 
     def __enter__(self) -> Document: ...
 
@@ -189,10 +243,27 @@ class Document:
     ) -> bool: ...
 
     def close(self) -> None:
-        """Free the document handle."""
+        """Release the document handle (freed now unless it is cached)."""
         ...
 
-    def __del__(self) -> None: ...
+    def reparse(
+        self,
+        content: Union[str, bytes],
+        strict: bool = True,
+        cache: bool = False
+    ) -> None:
+        """
+        Replace this document's contents by parsing new HEDL content.
+
+        Args:
+            content: HEDL content as string or bytes
+            strict: Enable strict reference validation
+            cache: Look up and store the result in the parse cache
+
+        Raises:
+            HedlError: If parsing fails (the document is left unchanged)
+        """
+        ...
 
     def _check_closed(self) -> None: ...
 
@@ -268,6 +339,37 @@ class Document:
         """
         ...
 
+    def to_json_into(self, buf: bytearray, include_metadata: bool = False) -> int:
+        """
+        Write JSON as UTF-8 bytes into a caller-supplied buffer.
+
+        Args:
+            buf: Writable buffer receiving the output; must be large enough
+            include_metadata: Include __type__ and __schema__ fields
+
+        Returns:
+            Number of bytes written to the start of buf
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE or len(buf)
+        """
+        ...
+
+    def to_json_view(self, include_metadata: bool = False) -> memoryview:
+        """
+        Convert to JSON as UTF-8 bytes, without decoding to str.
+
+        Args:
+            include_metadata: Include __type__ and __schema__ fields
+
+        Returns:
+            Read-only memoryview of the UTF-8 encoded JSON
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit
+        """
+        ...
+
     def to_yaml(self, include_metadata: bool = False) -> str:
         """
         Convert to YAML.
@@ -325,6 +427,40 @@ class Document:
         """
         ...
 
+    def to_parquet_view(self) -> memoryview:
+        """
+        Convert to Parquet format without copying the output.
+
+        Note: Only works for documents with matrix lists.
+
+        Returns:
+            Read-only memoryview over the native output buffer, freed once
+            the view is released
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit
+                       or document structure is incompatible
+        """
+        ...
+
+    def write_parquet(self, fileobj: Any) -> int:
+        """
+        Write the document in Parquet format to a binary file object.
+
+        Note: Only works for documents with matrix lists.
+
+        Args:
+            fileobj: Binary file-like object with a write() method
+
+        Returns:
+            Number of bytes of Parquet data
+
+        Raises:
+            HedlError: If output size exceeds HEDL_MAX_OUTPUT_SIZE limit
+                       or document structure is incompatible
+        """
+        ...
+
     def to_cypher(self, use_merge: bool = True) -> str:
         """
         Convert to Neo4j Cypher queries.
@@ -354,19 +490,36 @@ class Document:
         """
         ...
 
-def parse(content: Union[str, bytes], strict: bool = True) -> Document:
+def parse(
+    content: Union[str, bytes],
+    strict: bool = True,
+    limiter: Optional[ResourceLimiter] = None,
+    cache: bool = False
+) -> Document:
     """
     Parse HEDL content into a Document.
 
+    By default every call parses its input into its own native document,
+    which close() frees.
+
+    With cache=True, results are cached by the SHA-256 of the source (up to
+    PARSE_CACHE_SIZE documents and PARSE_CACHE_MAX_BYTES of source). Parsing
+    identical content again with cache=True returns a new Document sharing the
+    already-parsed native handle, so such Documents must not be used from
+    several threads at once. Their close() releases a reference; the native
+    document is freed once it is also evicted or clear_parse_cache() is called.
+
     Args:
         content: HEDL content as string or bytes
         strict: Enable strict reference validation
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+        cache: Look up and store the result in the parse cache
 
     Returns:
         Parsed Document object
 
     Raises:
-        HedlError: If parsing fails
+        HedlError: If parsing fails or the input exceeds the limiter's limit
 
     Example:
         >>> doc = hedl.parse('%VERSION: 1.0\\n---\\nkey: value')
@@ -375,6 +528,82 @@ def parse(content: Union[str, bytes], strict: bool = True) -> Document:
     """
     ...
 
+def parse_bytes(
+    content: bytes,
+    strict: bool = True,
+    limiter: Optional[ResourceLimiter] = None,
+    cache: bool = False
+) -> Document:
+    """
+    Parse UTF-8 encoded HEDL content into a Document.
+
+    Same as parse(), minus the str check and encode, for callers that already
+    hold bytes (file reads, network buffers).
+
+    Args:
+        content: HEDL content as UTF-8 bytes
+        strict: Enable strict reference validation
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+        cache: Look up and store the result in the parse cache
+
+    Returns:
+        Parsed Document object
+
+    Raises:
+        HedlError: If parsing fails or the input exceeds the limiter's limit
+    """
+    ...
+
+def parse_many(
+    contents: Iterable[Union[str, bytes]],
+    strict: bool = True,
+    limiter: Optional[ResourceLimiter] = None,
+    cache: bool = False
+) -> list[Document]:
+    """
+    Parse a batch of HEDL documents.
+
+    Args:
+        contents: Iterable of HEDL contents as strings or bytes
+        strict: Enable strict reference validation
+        limiter: Size limits for every document (default: DEFAULT_LIMITER)
+        cache: Look up and store each result in the parse cache
+
+    Returns:
+        List of parsed Document objects, in input order
+
+    Raises:
+        HedlError: If any item fails to parse
+    """
+    ...
+
+def parse_and_lint(
+    content: Union[str, bytes],
+    strict: bool = True,
+    limiter: Optional[ResourceLimiter] = None,
+    cache: bool = False
+) -> tuple[Document, Diagnostics]:
+    """
+    Parse HEDL content and lint the resulting document.
+
+    Args:
+        content: HEDL content as string or bytes
+        strict: Enable strict reference validation
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+        cache: Look up and store the result in the parse cache
+
+    Returns:
+        Tuple of (Document, Diagnostics); both should be closed by the caller
+
+    Raises:
+        HedlError: If parsing or linting fails
+    """
+    ...
+
+def clear_parse_cache() -> None:
+    """Release all documents held by the parse(..., cache=True) cache."""
+    ...
+
 def validate(content: Union[str, bytes], strict: bool = True) -> bool:
     """
     Validate HEDL content without creating a document.
@@ -386,6 +615,9 @@ def validate(content: Union[str, bytes], strict: bool = True) -> bool:
     Returns:
         True if valid, False otherwise
 
+    Raises:
+        HedlError: If the input is too long to pass to the library
+
     Example:
         >>> hedl.validate('%VERSION: 1.0\\n---\\nkey: value')
         True
@@ -394,12 +626,77 @@ def validate(content: Union[str, bytes], strict: bool = True) -> bool:
     """
     ...
 
-def from_json(content: Union[str, bytes]) -> Document:
+def validate_bytes(content: bytes, strict: bool = True) -> bool:
+    """
+    Validate UTF-8 encoded HEDL content without creating a document.
+
+    Same as validate(), minus the input type checks, for callers that already
+    hold bytes.
+
+    Args:
+        content: HEDL content as UTF-8 bytes
+        strict: Enable strict reference validation
+
+    Returns:
+        True if valid, False otherwise
+
+    Raises:
+        HedlError: If the input is too long to pass to the library
+    """
+    ...
+
+def parse_file(
+    path: Union[str, os.PathLike[str]],
+    strict: bool = True,
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
+    """
+    Parse a HEDL file into a Document (memory-mapped, not cached).
+
+    Args:
+        path: Path to the HEDL file
+        strict: Enable strict reference validation
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+
+    Returns:
+        Parsed Document object
+
+    Raises:
+        HedlError: If parsing fails
+        OSError: If the file cannot be opened
+    """
+    ...
+
+def validate_file(
+    path: Union[str, os.PathLike[str]],
+    strict: bool = True
+) -> bool:
+    """
+    Validate a HEDL file without creating a document (memory-mapped).
+
+    Args:
+        path: Path to the HEDL file
+        strict: Enable strict reference validation
+
+    Returns:
+        True if valid, False otherwise
+
+    Raises:
+        HedlError: If the file is too large to pass to the library
+        OSError: If the file cannot be opened
+    """
+    ...
+
+def from_json(
+    content: Union[str, bytes],
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
     """
     Parse JSON content into a HEDL Document.
 
     Args:
         content: JSON content as string or bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
 
     Returns:
         Parsed Document object
@@ -413,12 +710,37 @@ def from_json(content: Union[str, bytes]) -> Document:
     """
     ...
 
-def from_yaml(content: Union[str, bytes]) -> Document:
+def from_json_bytes(
+    content: bytes,
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
+    """
+    Parse UTF-8 encoded JSON content into a HEDL Document.
+
+    Same as from_json(), minus the str check and encode.
+
+    Args:
+        content: JSON content as UTF-8 bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+
+    Returns:
+        Parsed Document object
+
+    Raises:
+        HedlError: If parsing fails
+    """
+    ...
+
+def from_yaml(
+    content: Union[str, bytes],
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
     """
     Parse YAML content into a HEDL Document.
 
     Args:
         content: YAML content as string or bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
 
     Returns:
         Parsed Document object
@@ -428,12 +750,58 @@ def from_yaml(content: Union[str, bytes]) -> Document:
     """
     ...
 
-def from_xml(content: Union[str, bytes]) -> Document:
+def from_yaml_bytes(
+    content: bytes,
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
+    """
+    Parse UTF-8 encoded YAML content into a HEDL Document.
+
+    Same as from_yaml(), minus the str check and encode.
+
+    Args:
+        content: YAML content as UTF-8 bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+
+    Returns:
+        Parsed Document object
+
+    Raises:
+        HedlError: If parsing fails
+    """
+    ...
+
+def from_xml(
+    content: Union[str, bytes],
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
     """
     Parse XML content into a HEDL Document.
 
     Args:
         content: XML content as string or bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
+
+    Returns:
+        Parsed Document object
+
+    Raises:
+        HedlError: If parsing fails
+    """
+    ...
+
+def from_xml_bytes(
+    content: bytes,
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
+    """
+    Parse UTF-8 encoded XML content into a HEDL Document.
+
+    Same as from_xml(), minus the str check and encode.
+
+    Args:
+        content: XML content as UTF-8 bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
 
     Returns:
         Parsed Document object
@@ -443,12 +811,16 @@ def from_xml(content: Union[str, bytes]) -> Document:
     """
     ...
 
-def from_parquet(content: bytes) -> Document:
+def from_parquet(
+    content: bytes,
+    limiter: Optional[ResourceLimiter] = None
+) -> Document:
     """
     Parse Parquet content into a HEDL Document.
 
     Args:
         content: Parquet file contents as bytes
+        limiter: Size limits for the document (default: DEFAULT_LIMITER)
 
     Returns:
         Parsed Document object
@@ -7,7 +7,9 @@ that follow the HEDL standard format:
     [Component] Operation failed: {reason}. Expected: {expected}.
 """
 
-from typing import Optional, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping, Tuple
 
 
 # Error code constants (from FFI)
@@ -27,7 +29,7 @@ HEDL_ERR_NEO4J = -12
 
 
 # Error code to component mapping
-_ERROR_COMPONENTS: Dict[int, str] = {
+_ERROR_COMPONENTS: Mapping[int, str] = MappingProxyType({
     HEDL_ERR_NULL_PTR: "Resource",
     HEDL_ERR_INVALID_UTF8: "Encoding",
     HEDL_ERR_PARSE: "Parser",
@@ -40,11 +42,11 @@ _ERROR_COMPONENTS: Dict[int, str] = {
     HEDL_ERR_PARQUET: "Converter",
     HEDL_ERR_LINT: "Linter",
     HEDL_ERR_NEO4J: "Converter",
-}
+})
 
 
 # Error code to expected behavior mapping
-_ERROR_EXPECTATIONS: Dict[int, str] = {
+_ERROR_EXPECTATIONS: Mapping[int, str] = MappingProxyType({
     HEDL_ERR_NULL_PTR: "Document or resource must be open before operations",
     HEDL_ERR_INVALID_UTF8: "Valid UTF-8 encoded input",
     HEDL_ERR_PARSE: "Valid HEDL syntax without unclosed strings or invalid characters",
@@ -57,7 +59,46 @@ _ERROR_EXPECTATIONS: Dict[int, str] = {
     HEDL_ERR_PARQUET: "HEDL document with matrix lists and consistent column types",
     HEDL_ERR_LINT: "Valid HEDL document structure for analysis",
     HEDL_ERR_NEO4J: "HEDL document with graph-compatible structure (nodes and relationships)",
-}
+})
+
+
+# Error code to default operation mapping (used when the caller gives none)
+_DEFAULT_OPERATIONS: Mapping[int, str] = MappingProxyType({
+    HEDL_ERR_NULL_PTR: "Access resource",
+    HEDL_ERR_INVALID_UTF8: "Decode input",
+    HEDL_ERR_PARSE: "Parse HEDL document",
+    HEDL_ERR_CANONICALIZE: "Canonicalize document",
+    HEDL_ERR_JSON: "Convert JSON",
+    HEDL_ERR_ALLOC: "Allocate memory",
+    HEDL_ERR_YAML: "Convert YAML",
+    HEDL_ERR_XML: "Convert XML",
+    HEDL_ERR_CSV: "Convert CSV",
+    HEDL_ERR_PARQUET: "Convert Parquet",
+    HEDL_ERR_LINT: "Lint document",
+    HEDL_ERR_NEO4J: "Convert to Cypher",
+})
+
+
+# Per-code (component, expected) pairs, so format_standardized_error() does a
+# single table lookup.
+_CODE_PARTS: Mapping[int, Tuple[str, str]] = MappingProxyType({
+    code: (component, _ERROR_EXPECTATIONS[code])
+    for code, component in _ERROR_COMPONENTS.items()
+})
+_FALLBACK_PARTS = ("HEDL", "Valid input and proper usage")
+
+
+# (format_name, to_hedl) -> (operation, expected) for the formats the bindings
+# convert, so format_conversion_error() builds no strings for known formats.
+_CONV_TABLE: Dict[Tuple[str, bool], Tuple[str, str]] = {}
+for _name in ("JSON", "YAML", "XML", "CSV", "Parquet", "Neo4j"):
+    _CONV_TABLE[(_name, True)] = (
+        f"Convert {_name} to HEDL", f"Valid {_name} structure compatible with HEDL"
+    )
+    _CONV_TABLE[(_name, False)] = (
+        f"Convert HEDL to {_name}", f"HEDL document compatible with {_name} format"
+    )
+del _name
 
 
 def format_error(component: str, operation: str, reason: str, expected: str) -> str:
@@ -126,7 +167,10 @@ def format_conversion_error(format_name: str, detail: str, to_hedl: bool = False
     Returns:
         Formatted conversion error message.
     """
-    if to_hedl:
+    known = _CONV_TABLE.get((format_name, bool(to_hedl)))
+    if known is not None:
+        operation, expected = known
+    elif to_hedl:
         operation = f"Convert {format_name} to HEDL"
         expected = f"Valid {format_name} structure compatible with HEDL"
     else:
@@ -156,10 +200,19 @@ def format_validation_error(detail: str, requirement: str) -> str:
         component="Validator",
         operation="Validate HEDL document",
         reason=detail,
-        expected=f"{requirement}. See documentation for details"
+        expected=_validation_expected(requirement)
     )
 
 
+_VALIDATION_SUFFIX = ". See documentation for details"
+
+
+@lru_cache(maxsize=256)
+def _validation_expected(requirement: str) -> str:
+    """Expected-text for a validation rule; rules repeat, so the result is cached."""
+    return requirement + _VALIDATION_SUFFIX
+
+
 def format_resource_error(operation: str, detail: str, requirement: str) -> str:
     """
     Format a resource error message (memory, document access, etc.).
@@ -193,12 +246,18 @@ def format_ffi_error(function: str, detail: str) -> str:
     """
     return format_error(
         component="FFI",
-        operation=f"Call to '{function}'",
+        operation=_ffi_operation(function),
         reason=detail,
         expected="Valid FFI library setup and compatible data types"
     )
 
 
+@lru_cache(maxsize=128)
+def _ffi_operation(function: str) -> str:
+    """Operation string for an FFI function; the set of names is small and repeats."""
+    return f"Call to '{function}'"
+
+
 def format_encoding_error(operation: str, detail: str) -> str:
     """
     Format an encoding error message.
@@ -249,34 +308,30 @@ def format_standardized_error(
         ... )
         "[Parser] Parse configuration file failed: Unexpected character '}' at line 5. Expected: Valid HEDL syntax without unclosed strings or invalid characters."
     """
-    component = get_component_for_error_code(code)
-    expected = get_expectation_for_error_code(code)
+    return _format_standardized_cached(code, ffi_detail, operation, context)
+
+
+@lru_cache(maxsize=1024)
+def _format_standardized_cached(
+    code: int,
+    ffi_detail: str,
+    operation: Optional[str],
+    context: Optional[str]
+) -> str:
+    """Cached body of format_standardized_error(); the same error tends to repeat."""
+    component, expected = _CODE_PARTS.get(code, _FALLBACK_PARTS)
 
     # Auto-generate operation if not provided
     if operation is None:
-        operation = _get_default_operation(code)
+        operation = _DEFAULT_OPERATIONS.get(code, "HEDL operation")
 
     # Add context to operation if provided
     if context:
         operation = f"{operation} ({context})"
 
-    return format_error(component, operation, ffi_detail, expected)
+    return f"[{component}] {operation} failed: {ffi_detail}. Expected: {expected}."
 
 
 def _get_default_operation(code: int) -> str:
     """Get default operation name for an error code."""
-    operations = {
-        HEDL_ERR_NULL_PTR: "Access resource",
-        HEDL_ERR_INVALID_UTF8: "Decode input",
-        HEDL_ERR_PARSE: "Parse HEDL document",
-        HEDL_ERR_CANONICALIZE: "Canonicalize document",
-        HEDL_ERR_JSON: "Convert JSON",
-        HEDL_ERR_ALLOC: "Allocate memory",
-        HEDL_ERR_YAML: "Convert YAML",
-        HEDL_ERR_XML: "Convert XML",
-        HEDL_ERR_CSV: "Convert CSV",
-        HEDL_ERR_PARQUET: "Convert Parquet",
-        HEDL_ERR_LINT: "Lint document",
-        HEDL_ERR_NEO4J: "Convert to Cypher",
-    }
-    return operations.get(code, "HEDL operation")
+    return _DEFAULT_OPERATIONS.get(code, "HEDL operation")
@@ -2,16 +2,29 @@
 Library loading utilities for HEDL FFI bindings.
 """
 
-import ctypes
 import os
 import sys
+from ctypes import (
+    CDLL, CFUNCTYPE, POINTER, Structure,
+    c_char_p, c_int, c_size_t, c_uint8, c_void_p,
+)
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 # Global library instance
-_lib: Optional[ctypes.CDLL] = None
+_lib: Optional[CDLL] = None
 
+# Platform-specific library name
+if sys.platform == "darwin":
+    _LIB_NAME = "libhedl_ffi.dylib"
+elif sys.platform == "win32":
+    _LIB_NAME = "hedl_ffi.dll"
+else:
+    _LIB_NAME = "libhedl_ffi.so"
 
+
+@lru_cache(maxsize=1)
 def get_library_path() -> Optional[Path]:
     """
     Find the HEDL shared library.
@@ -22,16 +35,13 @@ def get_library_path() -> Optional[Path]:
     3. System library paths
     4. Relative to workspace root (for development)
 
+    The result is cached for the life of the process; call
+    get_library_path.cache_clear() after changing HEDL_LIB_PATH.
+
     Returns:
         Path to the library, or None if not found.
     """
-    # Platform-specific library name
-    if sys.platform == "darwin":
-        lib_name = "libhedl_ffi.dylib"
-    elif sys.platform == "win32":
-        lib_name = "hedl_ffi.dll"
-    else:
-        lib_name = "libhedl_ffi.so"
+    lib_name = _LIB_NAME
 
     # Check environment variable
     env_path = os.environ.get("HEDL_LIB_PATH")
@@ -50,18 +60,21 @@ def get_library_path() -> Optional[Path]:
     if local_lib.exists():
         return local_lib
 
-    # Check common build locations (for development)
+    # Check common build locations (for development). Only a source checkout
+    # has the Cargo workspace above the package; installed copies skip the
+    # target/ probes with a single stat.
     workspace_root = module_dir.parent.parent.parent
-    for build_type in ["release", "debug"]:
-        dev_lib = workspace_root / "target" / build_type / lib_name
-        if dev_lib.exists():
-            return dev_lib
+    if (workspace_root / "Cargo.toml").is_file():
+        for build_type in ("release", "debug"):
+            dev_lib = workspace_root / "target" / build_type / lib_name
+            if dev_lib.exists():
+                return dev_lib
 
     # Try system path (ctypes will search LD_LIBRARY_PATH, etc.)
     return None
 
 
-def load_library(path: Optional[Path] = None) -> ctypes.CDLL:
+def load_library(path: Optional[Path] = None) -> CDLL:
     """
     Load the HEDL shared library.
 
@@ -84,170 +97,131 @@ def load_library(path: Optional[Path] = None) -> ctypes.CDLL:
         path = get_library_path()
 
     if path is not None:
-        _lib = ctypes.CDLL(str(path))
+        _lib = LazyLib(str(path))
     else:
         # Try loading by name (relies on system library paths)
-        if sys.platform == "darwin":
-            _lib = ctypes.CDLL("libhedl_ffi.dylib")
-        elif sys.platform == "win32":
-            _lib = ctypes.CDLL("hedl_ffi.dll")
-        else:
-            _lib = ctypes.CDLL("libhedl_ffi.so")
-
-    _setup_function_signatures(_lib)
+        _lib = LazyLib(_LIB_NAME)
+
     return _lib
 
 
-def _setup_function_signatures(lib: ctypes.CDLL) -> None:
-    """Configure ctypes function signatures for type safety."""
+# Opaque pointer types
+class HedlDocument(Structure):
+    pass
 
-    # Opaque pointer types
-    class HedlDocument(ctypes.Structure):
-        pass
 
-    class HedlDiagnostics(ctypes.Structure):
-        pass
+class HedlDiagnostics(Structure):
+    pass
 
-    HedlDocumentPtr = ctypes.POINTER(HedlDocument)
-    HedlDiagnosticsPtr = ctypes.POINTER(HedlDiagnostics)
 
-    # Store types on library for access
-    lib.HedlDocument = HedlDocument
-    lib.HedlDiagnostics = HedlDiagnostics
-    lib.HedlDocumentPtr = HedlDocumentPtr
-    lib.HedlDiagnosticsPtr = HedlDiagnosticsPtr
+HedlDocumentPtr = POINTER(HedlDocument)
+HedlDiagnosticsPtr = POINTER(HedlDiagnostics)
 
-    # Error handling
-    lib.hedl_get_last_error.argtypes = []
-    lib.hedl_get_last_error.restype = ctypes.c_char_p
+# Zero-copy output callback: (data, len, user_data). The data is not
+# null-terminated, so it is declared as a raw pointer, not c_char_p.
+HedlOutputCallback = CFUNCTYPE(None, c_void_p, c_size_t, c_void_p)
 
-    # Memory management
-    lib.hedl_free_string.argtypes = [ctypes.c_char_p]
-    lib.hedl_free_string.restype = None
+# Pointer types used in the signature table, built once
+_P_C_INT = POINTER(c_int)
+_P_C_CHAR_P = POINTER(c_char_p)
+_P_C_SIZE_T = POINTER(c_size_t)
+_P_C_UINT8 = POINTER(c_uint8)
+_P_P_C_UINT8 = POINTER(_P_C_UINT8)
+_P_DOCUMENT_PTR = POINTER(HedlDocumentPtr)
+_P_DIAGNOSTICS_PTR = POINTER(HedlDiagnosticsPtr)
 
-    lib.hedl_free_document.argtypes = [HedlDocumentPtr]
-    lib.hedl_free_document.restype = None
 
-    lib.hedl_free_diagnostics.argtypes = [HedlDiagnosticsPtr]
-    lib.hedl_free_diagnostics.restype = None
+# Function signatures: (name, argtypes, restype). LazyLib applies an entry
+# the first time its function is looked up, so only functions a process
+# actually uses pay for signature setup.
+_SIGS = (
+    # Error handling
+    ("hedl_get_last_error", (), c_char_p),
 
-    lib.hedl_free_bytes.argtypes = [ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t]
-    lib.hedl_free_bytes.restype = None
+    # Memory management
+    ("hedl_free_string", (c_char_p,), None),
+    ("hedl_free_document", (HedlDocumentPtr,), None),
+    ("hedl_free_diagnostics", (HedlDiagnosticsPtr,), None),
+    ("hedl_free_bytes", (_P_C_UINT8, c_size_t), None),
 
     # Parsing
-    lib.hedl_parse.argtypes = [
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.POINTER(HedlDocumentPtr)
-    ]
-    lib.hedl_parse.restype = ctypes.c_int
-
-    lib.hedl_validate.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
-    lib.hedl_validate.restype = ctypes.c_int
+    ("hedl_parse", (c_char_p, c_int, c_int, _P_DOCUMENT_PTR), c_int),
+    ("hedl_validate", (c_char_p, c_int, c_int), c_int),
 
     # Document info
-    lib.hedl_get_version.argtypes = [
-        HedlDocumentPtr,
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int)
-    ]
-    lib.hedl_get_version.restype = ctypes.c_int
-
-    lib.hedl_schema_count.argtypes = [HedlDocumentPtr]
-    lib.hedl_schema_count.restype = ctypes.c_int
-
-    lib.hedl_alias_count.argtypes = [HedlDocumentPtr]
-    lib.hedl_alias_count.restype = ctypes.c_int
-
-    lib.hedl_root_item_count.argtypes = [HedlDocumentPtr]
-    lib.hedl_root_item_count.restype = ctypes.c_int
+    ("hedl_get_version", (HedlDocumentPtr, _P_C_INT, _P_C_INT), c_int),
+    ("hedl_schema_count", (HedlDocumentPtr,), c_int),
+    ("hedl_alias_count", (HedlDocumentPtr,), c_int),
+    ("hedl_root_item_count", (HedlDocumentPtr,), c_int),
 
     # Canonicalization
-    lib.hedl_canonicalize.argtypes = [HedlDocumentPtr, ctypes.POINTER(ctypes.c_char_p)]
-    lib.hedl_canonicalize.restype = ctypes.c_int
+    ("hedl_canonicalize", (HedlDocumentPtr, _P_C_CHAR_P), c_int),
+    ("hedl_canonicalize_callback", (HedlDocumentPtr, HedlOutputCallback, c_void_p), c_int),
 
     # JSON
-    lib.hedl_to_json.argtypes = [
-        HedlDocumentPtr,
-        ctypes.c_int,
-        ctypes.POINTER(ctypes.c_char_p)
-    ]
-    lib.hedl_to_json.restype = ctypes.c_int
-
-    lib.hedl_from_json.argtypes = [
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.POINTER(HedlDocumentPtr)
-    ]
-    lib.hedl_from_json.restype = ctypes.c_int
+    ("hedl_to_json", (HedlDocumentPtr, c_int, _P_C_CHAR_P), c_int),
+    ("hedl_to_json_callback", (HedlDocumentPtr, c_int, HedlOutputCallback, c_void_p), c_int),
+    ("hedl_from_json", (c_char_p, c_int, _P_DOCUMENT_PTR), c_int),
 
     # YAML
-    lib.hedl_to_yaml.argtypes = [
-        HedlDocumentPtr,
-        ctypes.c_int,
-        ctypes.POINTER(ctypes.c_char_p)
-    ]
-    lib.hedl_to_yaml.restype = ctypes.c_int
-
-    lib.hedl_from_yaml.argtypes = [
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.POINTER(HedlDocumentPtr)
-    ]
-    lib.hedl_from_yaml.restype = ctypes.c_int
+    ("hedl_to_yaml", (HedlDocumentPtr, c_int, _P_C_CHAR_P), c_int),
+    ("hedl_to_yaml_callback", (HedlDocumentPtr, c_int, HedlOutputCallback, c_void_p), c_int),
+    ("hedl_from_yaml", (c_char_p, c_int, _P_DOCUMENT_PTR), c_int),
 
     # XML
-    lib.hedl_to_xml.argtypes = [HedlDocumentPtr, ctypes.POINTER(ctypes.c_char_p)]
-    lib.hedl_to_xml.restype = ctypes.c_int
-
-    lib.hedl_from_xml.argtypes = [
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.POINTER(HedlDocumentPtr)
-    ]
-    lib.hedl_from_xml.restype = ctypes.c_int
+    ("hedl_to_xml", (HedlDocumentPtr, _P_C_CHAR_P), c_int),
+    ("hedl_to_xml_callback", (HedlDocumentPtr, HedlOutputCallback, c_void_p), c_int),
+    ("hedl_from_xml", (c_char_p, c_int, _P_DOCUMENT_PTR), c_int),
 
     # CSV
-    lib.hedl_to_csv.argtypes = [HedlDocumentPtr, ctypes.POINTER(ctypes.c_char_p)]
-    lib.hedl_to_csv.restype = ctypes.c_int
+    ("hedl_to_csv", (HedlDocumentPtr, _P_C_CHAR_P), c_int),
+    ("hedl_to_csv_callback", (HedlDocumentPtr, HedlOutputCallback, c_void_p), c_int),
 
     # Parquet
-    lib.hedl_to_parquet.argtypes = [
-        HedlDocumentPtr,
-        ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-        ctypes.POINTER(ctypes.c_size_t)
-    ]
-    lib.hedl_to_parquet.restype = ctypes.c_int
-
-    lib.hedl_from_parquet.argtypes = [
-        ctypes.POINTER(ctypes.c_uint8),
-        ctypes.c_size_t,
-        ctypes.POINTER(HedlDocumentPtr)
-    ]
-    lib.hedl_from_parquet.restype = ctypes.c_int
+    ("hedl_to_parquet", (HedlDocumentPtr, _P_P_C_UINT8, _P_C_SIZE_T), c_int),
+    # The input is declared as c_char_p (ABI-identical to const uint8_t*) so
+    # bytes objects are passed by pointer without being copied.
+    ("hedl_from_parquet", (c_char_p, c_size_t, _P_DOCUMENT_PTR), c_int),
 
     # Neo4j
-    lib.hedl_to_neo4j_cypher.argtypes = [
-        HedlDocumentPtr,
-        ctypes.c_int,
-        ctypes.POINTER(ctypes.c_char_p)
-    ]
-    lib.hedl_to_neo4j_cypher.restype = ctypes.c_int
+    ("hedl_to_neo4j_cypher", (HedlDocumentPtr, c_int, _P_C_CHAR_P), c_int),
+    (
+        "hedl_to_neo4j_cypher_callback",
+        (HedlDocumentPtr, c_int, HedlOutputCallback, c_void_p),
+        c_int,
+    ),
 
     # Linting
-    lib.hedl_lint.argtypes = [HedlDocumentPtr, ctypes.POINTER(HedlDiagnosticsPtr)]
-    lib.hedl_lint.restype = ctypes.c_int
+    ("hedl_lint", (HedlDocumentPtr, _P_DIAGNOSTICS_PTR), c_int),
+    ("hedl_diagnostics_count", (HedlDiagnosticsPtr,), c_int),
+    ("hedl_diagnostics_get", (HedlDiagnosticsPtr, c_int, _P_C_CHAR_P), c_int),
+    ("hedl_diagnostics_severity", (HedlDiagnosticsPtr, c_int), c_int),
+)
 
-    lib.hedl_diagnostics_count.argtypes = [HedlDiagnosticsPtr]
-    lib.hedl_diagnostics_count.restype = ctypes.c_int
+# name -> (argtypes, restype), built from _SIGS in a single pass
+_SIG_BY_NAME = {name: (argtypes, restype) for name, argtypes, restype in _SIGS}
 
-    lib.hedl_diagnostics_get.argtypes = [
-        HedlDiagnosticsPtr,
-        ctypes.c_int,
-        ctypes.POINTER(ctypes.c_char_p)
-    ]
-    lib.hedl_diagnostics_get.restype = ctypes.c_int
 
-    lib.hedl_diagnostics_severity.argtypes = [HedlDiagnosticsPtr, ctypes.c_int]
-    lib.hedl_diagnostics_severity.restype = ctypes.c_int
+class LazyLib(CDLL):
+    """
+    CDLL that configures each function's signature on first attribute access.
+
+    CDLL already caches a function in the instance dict after the first
+    lookup, so __getattr__ (and the signature setup) runs once per function.
+    Item access (lib["name"]) returns a fresh, unconfigured function object,
+    as with a plain CDLL.
+    """
+
+    # Shared opaque types, available without touching any function
+    HedlDocument = HedlDocument
+    HedlDiagnostics = HedlDiagnostics
+    HedlDocumentPtr = HedlDocumentPtr
+    HedlDiagnosticsPtr = HedlDiagnosticsPtr
+    HedlOutputCallback = HedlOutputCallback
+
+    def __getattr__(self, name: str):
+        func = super().__getattr__(name)
+        sig = _SIG_BY_NAME.get(name)
+        if sig is not None:
+            func.argtypes, func.restype = sig
+        return func
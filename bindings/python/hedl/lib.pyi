@@ -5,9 +5,22 @@ Provides type annotations for FFI library discovery and loading.
 """
 
 import ctypes
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+class LazyLib(ctypes.CDLL):
+    """CDLL that configures each function's signature on first attribute access."""
+
+    HedlDocument: type[ctypes.Structure]
+    HedlDiagnostics: type[ctypes.Structure]
+    HedlDocumentPtr: type[ctypes._Pointer[ctypes.Structure]]
+    HedlDiagnosticsPtr: type[ctypes._Pointer[ctypes.Structure]]
+    HedlOutputCallback: type[ctypes._CFuncPtr]
+
+    def __getattr__(self, name: str) -> ctypes._CFuncPtr: ...
+
+@lru_cache(maxsize=1)
 def get_library_path() -> Optional[Path]:
     """
     Find the HEDL shared library.
@@ -18,6 +31,9 @@ def get_library_path() -> Optional[Path]:
     3. System library paths
     4. Relative to workspace root (for development)
 
+    The result is cached for the life of the process; call
+    get_library_path.cache_clear() after changing HEDL_LIB_PATH.
+
     Returns:
         Path to the library, or None if not found
     """
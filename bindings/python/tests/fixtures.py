@@ -8,8 +8,58 @@ across language bindings.
 
 import json
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+
+# Path to common fixtures directory
+# From bindings/python/tests/fixtures.py -> bindings/common/fixtures
+_FIXTURES_DIR = (Path(__file__).parent.parent.parent / "common" / "fixtures").resolve()
+_FIXTURES_DIR_STR = str(_FIXTURES_DIR)
+
+
+@lru_cache(maxsize=64)
+def _read_cached(fixtures_dir: str, filename: str) -> bytes:
+    """
+    Read a fixture file once per process; fixtures are read-only test data.
+
+    Reads straight from the file descriptor in a single read sized from
+    fstat, without the buffered reader layer.
+    """
+    fd = os.open(os.path.join(fixtures_dir, filename), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # A regular file is normally read in one go; loop just in case.
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data
+
+
+class _TextFixtures:
+    """
+    str view of a Fixtures instance.
+
+    Exposes the same fixture properties, decoded from UTF-8, for tests that
+    need text rather than bytes.
+    """
+
+    def __init__(self, fixtures: "Fixtures"):
+        self._fixtures = fixtures
+
+    def __getattr__(self, name: str) -> str:
+        value = getattr(self._fixtures, name)
+        if not isinstance(value, bytes):
+            raise AttributeError(f"{name!r} is not a fixture")
+        text = value.decode('utf-8')
+        setattr(self, name, text)
+        return text
 
 
 class Fixtures:
@@ -18,93 +68,113 @@ class Fixtures:
 
     All fixtures are loaded from bindings/common/fixtures directory
     to ensure consistency across language bindings.
+
+    Fixtures are returned as UTF-8 bytes, which the bindings accept directly;
+    use `as_str` for the decoded text.
     """
 
     def __init__(self):
-        """Initialize the fixtures loader and load manifest."""
-        # Path to common fixtures directory
-        # From bindings/python/tests/fixtures.py -> bindings/common/fixtures
-        self._fixtures_dir = Path(__file__).parent.parent.parent / "common" / "fixtures"
-
-        # Load manifest
-        manifest_path = self._fixtures_dir / "manifest.json"
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            self._manifest = json.load(f)
-
-    def _read_file(self, filename: str, binary: bool = False) -> str | bytes:
+        """Initialize the fixtures loader; no files are read until first use."""
+        self._fixtures_dir = _FIXTURES_DIR
+
+        # Manifest is loaded on first use
+        self._manifest_path = self._fixtures_dir / "manifest.json"
+
+    @cached_property
+    def _manifest(self) -> Dict[str, Any]:
+        """Fixture manifest, read from disk on first access."""
+        with open(self._manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @cached_property
+    def _fixture_paths(self) -> Dict[Tuple[str, str], str]:
+        """Flat (category, format) -> filename table built from the manifest."""
+        return {
+            (category, fmt): filename
+            for category, entry in self._manifest["fixtures"].items()
+            for fmt, filename in entry["files"].items()
+        }
+
+    @cached_property
+    def _error_paths(self) -> Dict[str, str]:
+        """Flat error type -> filename table built from the manifest."""
+        return {name: entry["file"] for name, entry in self._manifest["errors"].items()}
+
+    def _read_file(self, filename: str, binary: bool = True) -> str | bytes:
         """
         Read a fixture file.
 
         Args:
             filename: Name of the file to read
-            binary: If True, read as binary, otherwise as text
+            binary: If True, return the raw bytes, otherwise decode as UTF-8
 
         Returns:
-            File contents as string or bytes
+            File contents as bytes or string
         """
-        filepath = self._fixtures_dir / filename
-        mode = 'rb' if binary else 'r'
-        encoding = None if binary else 'utf-8'
+        data = _read_cached(_FIXTURES_DIR_STR, filename)
+        return data if binary else data.decode('utf-8')
 
-        with open(filepath, mode, encoding=encoding) as f:
-            return f.read()
+    @cached_property
+    def as_str(self) -> _TextFixtures:
+        """Text view of these fixtures (e.g. `fixtures.as_str.basic_hedl`)."""
+        return _TextFixtures(self)
 
     # Basic fixtures
-    @property
-    def basic_hedl(self) -> str:
+    @cached_property
+    def basic_hedl(self) -> bytes:
         """Get basic HEDL sample document."""
-        return self._read_file(self._manifest["fixtures"]["basic"]["files"]["hedl"])
+        return self._read_file(self._fixture_paths[("basic", "hedl")])
 
-    @property
-    def basic_json(self) -> str:
+    @cached_property
+    def basic_json(self) -> bytes:
         """Get basic JSON sample document."""
-        return self._read_file(self._manifest["fixtures"]["basic"]["files"]["json"])
+        return self._read_file(self._fixture_paths[("basic", "json")])
 
-    @property
-    def basic_yaml(self) -> str:
+    @cached_property
+    def basic_yaml(self) -> bytes:
         """Get basic YAML sample document."""
-        return self._read_file(self._manifest["fixtures"]["basic"]["files"]["yaml"])
+        return self._read_file(self._fixture_paths[("basic", "yaml")])
 
-    @property
-    def basic_xml(self) -> str:
+    @cached_property
+    def basic_xml(self) -> bytes:
         """Get basic XML sample document."""
-        return self._read_file(self._manifest["fixtures"]["basic"]["files"]["xml"])
+        return self._read_file(self._fixture_paths[("basic", "xml")])
 
     # Type-specific fixtures
-    @property
-    def scalars_hedl(self) -> str:
+    @cached_property
+    def scalars_hedl(self) -> bytes:
         """Get HEDL document with various scalar types."""
-        return self._read_file(self._manifest["fixtures"]["scalars"]["files"]["hedl"])
+        return self._read_file(self._fixture_paths[("scalars", "hedl")])
 
-    @property
-    def nested_hedl(self) -> str:
+    @cached_property
+    def nested_hedl(self) -> bytes:
         """Get HEDL document with nested structures."""
-        return self._read_file(self._manifest["fixtures"]["nested"]["files"]["hedl"])
+        return self._read_file(self._fixture_paths[("nested", "hedl")])
 
-    @property
-    def lists_hedl(self) -> str:
+    @cached_property
+    def lists_hedl(self) -> bytes:
         """Get HEDL document with lists and arrays."""
-        return self._read_file(self._manifest["fixtures"]["lists"]["files"]["hedl"])
+        return self._read_file(self._fixture_paths[("lists", "hedl")])
 
     # Performance fixtures
-    @property
-    def large_hedl(self) -> str:
+    @cached_property
+    def large_hedl(self) -> bytes:
         """Get large HEDL document for performance testing."""
-        return self._read_file(self._manifest["fixtures"]["large"]["files"]["hedl"])
+        return self._read_file(self._fixture_paths[("large", "hedl")])
 
     # Error fixtures
-    @property
-    def error_invalid_syntax(self) -> str:
+    @cached_property
+    def error_invalid_syntax(self) -> bytes:
         """Get invalid HEDL syntax for error testing."""
-        return self._read_file(self._manifest["errors"]["invalid_syntax"]["file"])
+        return self._read_file(self._error_paths["invalid_syntax"])
 
-    @property
-    def error_malformed(self) -> str:
+    @cached_property
+    def error_malformed(self) -> bytes:
         """Get malformed HEDL document for error testing."""
-        return self._read_file(self._manifest["errors"]["malformed"]["file"])
+        return self._read_file(self._error_paths["malformed"])
 
     # Utility methods
-    def get_fixture(self, category: str, name: str, format: str = "hedl") -> str:
+    def get_fixture(self, category: str, name: str, format: str = "hedl") -> bytes:
         """
         Get a specific fixture by category and name.
 
@@ -114,20 +184,19 @@ class Fixtures:
             format: File format ("hedl", "json", "yaml", "xml")
 
         Returns:
-            Fixture content as string
+            Fixture content as bytes
 
         Example:
             >>> fixtures = Fixtures()
             >>> hedl = fixtures.get_fixture("basic", "basic", "hedl")
         """
-        if category in self._manifest["fixtures"]:
-            files = self._manifest["fixtures"][category]["files"]
-            if format in files:
-                return self._read_file(files[format])
-
-        raise ValueError(f"Fixture not found: category={category}, format={format}")
+        try:
+            filename = self._fixture_paths[(category, format)]
+        except KeyError:
+            raise ValueError(f"Fixture not found: category={category}, format={format}") from None
+        return self._read_file(filename)
 
-    def get_error_fixture(self, error_type: str) -> str:
+    def get_error_fixture(self, error_type: str) -> bytes:
         """
         Get an error fixture by type.
 
@@ -137,18 +206,33 @@ class Fixtures:
         Returns:
             Error fixture content
         """
-        if error_type in self._manifest["errors"]:
-            return self._read_file(self._manifest["errors"][error_type]["file"])
+        try:
+            filename = self._error_paths[error_type]
+        except KeyError:
+            raise ValueError(f"Error fixture not found: {error_type}") from None
+        return self._read_file(filename)
 
-        raise ValueError(f"Error fixture not found: {error_type}")
 
+# Legacy constants for backward compatibility, mapped to Fixtures properties
+_LEGACY_CONSTANTS = {
+    "SAMPLE_HEDL": "basic_hedl",
+    "SAMPLE_JSON": "basic_json",
+    "SAMPLE_YAML": "basic_yaml",
+    "SAMPLE_XML": "basic_xml",
+}
 
-# Global fixtures instance for convenient access
-fixtures = Fixtures()
 
+def __getattr__(name: str) -> Any:
+    """
+    Create the global `fixtures` instance and legacy constants on first access.
 
-# Legacy constants for backward compatibility
-SAMPLE_HEDL = fixtures.basic_hedl
-SAMPLE_JSON = fixtures.basic_json
-SAMPLE_YAML = fixtures.basic_yaml
-SAMPLE_XML = fixtures.basic_xml
+    Importing this module therefore does no file IO.
+    """
+    module_globals = globals()
+    if name == "fixtures":
+        return module_globals.setdefault("fixtures", Fixtures())
+    if name in _LEGACY_CONSTANTS:
+        instance = module_globals.get("fixtures") or __getattr__("fixtures")
+        value = module_globals[name] = getattr(instance.as_str, _LEGACY_CONSTANTS[name])
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -30,60 +30,60 @@ from hedl.errors import (
 
 
 # Error message pattern: [Component] Operation failed: {reason}. Expected: {expected}.
-ERROR_PATTERN = re.compile(r'^\[(\w+)\] (.+?) failed: (.+?)\. Expected: (.+)\.$')
+ERROR_PATTERN = re.compile(r'\[(\w+)\] (.+?) failed: (.+?)\. Expected: (.+)\.')
+_MATCH = ERROR_PATTERN.fullmatch
 
 
 def test_error_format_function():
     """Test the basic error formatting function."""
     msg = format_error("Parser", "Parse document", "Syntax error at line 5", "Valid syntax")
-    assert ERROR_PATTERN.match(msg)
+    assert _MATCH(msg)
     assert msg == "[Parser] Parse document failed: Syntax error at line 5. Expected: Valid syntax."
 
 
 def test_parse_error_format():
     """Test parse error formatting."""
     msg = format_parse_error("Unexpected character '}'")
-    assert ERROR_PATTERN.match(msg)
-    assert "[Parser]" in msg
-    assert "failed:" in msg
-    assert "Expected:" in msg
+    assert msg.startswith("[Parser] ") and msg.endswith(".")
+    assert " failed: " in msg
+    assert ". Expected: " in msg
 
 
 def test_conversion_error_format():
     """Test conversion error formatting."""
     # To HEDL
     msg = format_conversion_error("JSON", "Invalid structure", to_hedl=True)
-    assert ERROR_PATTERN.match(msg)
-    assert "[Converter]" in msg
+    assert msg.startswith("[Converter] ") and msg.endswith(".")
+    assert ". Expected: " in msg
     assert "Convert JSON to HEDL" in msg
 
     # From HEDL
     msg = format_conversion_error("XML", "Cannot serialize", to_hedl=False)
-    assert ERROR_PATTERN.match(msg)
-    assert "[Converter]" in msg
+    assert msg.startswith("[Converter] ") and msg.endswith(".")
+    assert ". Expected: " in msg
     assert "Convert HEDL to XML" in msg
 
 
 def test_resource_error_format():
     """Test resource error formatting."""
     msg = format_resource_error("Allocate memory", "Size limit exceeded", "Increase limit")
-    assert ERROR_PATTERN.match(msg)
-    assert "[Resource]" in msg
+    assert msg.startswith("[Resource] ") and msg.endswith(".")
+    assert " failed: " in msg and ". Expected: " in msg
 
 
 def test_ffi_error_format():
     """Test FFI error formatting."""
     msg = format_ffi_error("hedl_parse", "Null pointer argument")
-    assert ERROR_PATTERN.match(msg)
-    assert "[FFI]" in msg
+    assert msg.startswith("[FFI] ") and msg.endswith(".")
+    assert " failed: " in msg and ". Expected: " in msg
     assert "hedl_parse" in msg
 
 
 def test_encoding_error_format():
     """Test encoding error formatting."""
     msg = format_encoding_error("Decode input", "Invalid UTF-8 byte sequence")
-    assert ERROR_PATTERN.match(msg)
-    assert "[Encoding]" in msg
+    assert msg.startswith("[Encoding] ") and msg.endswith(".")
+    assert " failed: " in msg and ". Expected: " in msg
 
 
 def test_standardized_error_format():
@@ -94,7 +94,7 @@ def test_standardized_error_format():
         operation="Parse configuration",
         context="config.hedl, 1024 bytes"
     )
-    assert ERROR_PATTERN.match(msg)
+    assert _MATCH(msg)
     assert "[Parser]" in msg
     assert "Parse configuration" in msg
     assert "config.hedl, 1024 bytes" in msg
@@ -134,41 +134,31 @@ def test_resource_error_closed_document():
         _ = doc.version
 
     error_msg = str(exc_info.value)
-    match = ERROR_PATTERN.match(error_msg)
+    match = _MATCH(error_msg)
     assert match is not None, f"Error message doesn't match pattern: {error_msg}"
     assert match.group(1) == "Resource"
     assert "closed" in error_msg.lower()
 
 
-def test_resource_error_output_size_limit():
+def test_resource_error_output_size_limit(monkeypatch):
     """Test that output size limit errors follow standard format."""
-    # Set a very small limit to trigger the error
-    original_limit = os.environ.get('HEDL_MAX_OUTPUT_SIZE')
-    os.environ['HEDL_MAX_OUTPUT_SIZE'] = '100'  # 100 bytes
-
-    try:
-        # Need to reload the module to pick up the new environment variable
-        # For this test, we'll just verify the helper function works correctly
-        from hedl.core import _check_output_size
+    from hedl.core import DEFAULT_LIMITER
 
-        large_output = "x" * 1000  # 1000 bytes
+    # The environment variable is only read at import, so set a very small
+    # limit on the default limiter directly to trigger the error
+    monkeypatch.setattr(DEFAULT_LIMITER, "max_output_size", 100)  # 100 bytes
 
-        with pytest.raises(HedlError) as exc_info:
-            _check_output_size(large_output, "Convert HEDL to JSON")
+    large_output = "x" * 1000  # 1000 bytes
 
-        error_msg = str(exc_info.value)
-        match = ERROR_PATTERN.match(error_msg)
-        assert match is not None, f"Error message doesn't match pattern: {error_msg}"
-        assert match.group(1) == "Resource"
-        assert "Output size" in error_msg
-        assert "HEDL_MAX_OUTPUT_SIZE" in error_msg
+    with pytest.raises(HedlError) as exc_info:
+        DEFAULT_LIMITER.check_output(len(large_output), "Convert HEDL to JSON")
 
-    finally:
-        # Restore original limit
-        if original_limit is None:
-            os.environ.pop('HEDL_MAX_OUTPUT_SIZE', None)
-        else:
-            os.environ['HEDL_MAX_OUTPUT_SIZE'] = original_limit
+    error_msg = str(exc_info.value)
+    match = _MATCH(error_msg)
+    assert match is not None, f"Error message doesn't match pattern: {error_msg}"
+    assert match.group(1) == "Resource"
+    assert "Output size" in error_msg
+    assert "HEDL_MAX_OUTPUT_SIZE" in error_msg
 
 
 def test_diagnostics_closed_error():
@@ -181,36 +171,38 @@ def test_diagnostics_closed_error():
         _ = diag.get(0)
 
     error_msg = str(exc_info.value)
-    match = ERROR_PATTERN.match(error_msg)
+    match = _MATCH(error_msg)
     assert match is not None, f"Error message doesn't match pattern: {error_msg}"
     assert match.group(1) == "Resource"
     assert "Diagnostics" in error_msg
     assert "closed" in error_msg.lower()
 
 
-def test_error_code_preservation():
-    """Test that error codes are preserved in exceptions."""
+@pytest.fixture(scope="session")
+def invalid_parse_exc():
+    """HedlError raised by parsing invalid input, captured once per session."""
     with pytest.raises(HedlError) as exc_info:
         parse("invalid hedl")
+    return exc_info.value
 
-    assert hasattr(exc_info.value, 'code')
-    assert exc_info.value.code == HEDL_ERR_PARSE
 
+def test_error_code_preservation(invalid_parse_exc):
+    """Test that error codes are preserved in exceptions."""
+    assert hasattr(invalid_parse_exc, 'code')
+    assert invalid_parse_exc.code == HEDL_ERR_PARSE
 
-def test_error_context_preservation():
-    """Test that error context is preserved."""
-    with pytest.raises(HedlError) as exc_info:
-        parse("invalid hedl")
 
-    assert hasattr(exc_info.value, 'context')
-    assert isinstance(exc_info.value.context, dict)
+def test_error_context_preservation(invalid_parse_exc):
+    """Test that error context is preserved."""
+    assert hasattr(invalid_parse_exc, 'context')
+    assert isinstance(invalid_parse_exc.context, dict)
 
 
 def test_all_error_codes_have_components():
     """Test that all error codes have component mappings."""
     from hedl.errors import _ERROR_COMPONENTS, _ERROR_EXPECTATIONS
 
-    error_codes = [
+    error_codes = frozenset([
         HEDL_ERR_PARSE,
         HEDL_ERR_JSON,
         HEDL_ERR_ALLOC,
@@ -221,30 +213,26 @@ def test_all_error_codes_have_components():
         -10, # PARQUET
         -11, # LINT
         -12, # NEO4J
-    ]
+    ])
 
-    for code in error_codes:
-        assert code in _ERROR_COMPONENTS, f"Error code {code} missing component mapping"
-        assert code in _ERROR_EXPECTATIONS, f"Error code {code} missing expectation mapping"
+    assert error_codes <= _ERROR_COMPONENTS.keys(), \
+        f"Error codes {sorted(error_codes - _ERROR_COMPONENTS.keys())} missing component mapping"
+    assert error_codes <= _ERROR_EXPECTATIONS.keys(), \
+        f"Error codes {sorted(error_codes - _ERROR_EXPECTATIONS.keys())} missing expectation mapping"
 
 
 def test_error_message_consistency():
     """Test that error messages are consistent across similar operations."""
     # Parse different invalid formats - all should have consistent structure
     invalid_inputs = [
-        ("hedl", "invalid hedl syntax"),
-        ("json", "{invalid json}"),
-        ("yaml", "- invalid: yaml: structure"),
+        (parse, "invalid hedl syntax"),
+        (from_json, "{invalid json}"),
+        (from_yaml, "- invalid: yaml: structure"),
     ]
 
-    for format_type, invalid_input in invalid_inputs:
+    for parser, invalid_input in invalid_inputs:
         try:
-            if format_type == "hedl":
-                parse(invalid_input)
-            elif format_type == "json":
-                from_json(invalid_input)
-            elif format_type == "yaml":
-                from_yaml(invalid_input)
+            parser(invalid_input)
         except HedlError as e:
             error_msg = str(e)
             # All should contain "failed:" and "Expected:"
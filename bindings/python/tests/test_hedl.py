@@ -1,16 +1,26 @@
 """Tests for HEDL Python bindings."""
+import gc
+import io
 import os
 import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
 
 # Set library path before importing hedl
 lib_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'target', 'release')
 os.environ['HEDL_LIB_PATH'] = lib_path
 
-from hedl import parse, validate, from_json, from_yaml, from_xml, Document, Diagnostics, HedlError
+from hedl import (
+    parse, parse_bytes, parse_many, parse_and_lint, validate, validate_bytes,
+    parse_file, validate_file, from_json, from_json_bytes, from_yaml, from_xml,
+    clear_parse_cache,
+    Document, Diagnostics, HedlError, ResourceLimiter,
+)
 from fixtures import fixtures
 
-# Use shared fixtures from common/fixtures directory
+# Use shared fixtures from common/fixtures directory (UTF-8 bytes)
 SAMPLE_HEDL = fixtures.basic_hedl
 SAMPLE_JSON = fixtures.basic_json
 SAMPLE_YAML = fixtures.basic_yaml
@@ -22,7 +32,7 @@ class TestParse(unittest.TestCase):
 
     def test_parse_valid(self):
         """Test parsing valid HEDL content."""
-        doc = parse(SAMPLE_HEDL)
+        doc = parse(fixtures.as_str.basic_hedl)
         self.assertIsInstance(doc, Document)
         doc.close()
 
@@ -36,23 +46,115 @@ class TestParse(unittest.TestCase):
         with self.assertRaises(HedlError):
             parse(fixtures.error_invalid_syntax)
 
+    def test_parse_bytes(self):
+        """Test parsing pre-encoded HEDL content."""
+        with parse_bytes(SAMPLE_HEDL) as doc:
+            self.assertEqual(doc.version, (1, 0))
+
+    def test_parse_many(self):
+        """Test parsing a batch of documents."""
+        docs = parse_many([SAMPLE_HEDL, SAMPLE_HEDL])
+        self.assertEqual(len(docs), 2)
+        for doc in docs:
+            self.assertIsInstance(doc, Document)
+            doc.close()
+
+    def test_parse_many_invalid(self):
+        """Test a failing item in a batch raises error."""
+        with self.assertRaises(HedlError):
+            parse_many([SAMPLE_HEDL, fixtures.error_invalid_syntax])
+
     def test_validate_valid(self):
         """Test validating valid content."""
-        self.assertTrue(validate(SAMPLE_HEDL))
+        self.assertTrue(validate(fixtures.as_str.basic_hedl))
 
     def test_validate_invalid(self):
         """Test validating invalid content."""
         self.assertFalse(validate(fixtures.error_invalid_syntax))
 
+    def test_validate_bytes(self):
+        """Test validating pre-encoded content."""
+        self.assertTrue(validate_bytes(SAMPLE_HEDL))
+        self.assertFalse(validate_bytes(fixtures.error_invalid_syntax))
 
-class TestDocumentProperties(unittest.TestCase):
-    """Test Document properties."""
+
+class TestFiles(unittest.TestCase):
+    """Test parsing and validating files."""
 
     def setUp(self):
-        self.doc = parse(SAMPLE_HEDL)
+        fd, self.path = tempfile.mkstemp(suffix=".hedl")
+        with os.fdopen(fd, "wb") as f:
+            f.write(SAMPLE_HEDL)
 
     def tearDown(self):
-        self.doc.close()
+        os.unlink(self.path)
+
+    def test_parse_file(self):
+        """Test parsing a file."""
+        with parse_file(self.path) as doc:
+            self.assertEqual(doc.version, (1, 0))
+
+    def test_validate_file(self):
+        """Test validating a file."""
+        self.assertTrue(validate_file(self.path))
+
+    def test_validate_empty_file(self):
+        """Test an empty file is invalid."""
+        open(self.path, "wb").close()
+        self.assertFalse(validate_file(self.path))
+
+    def test_file_matches_in_memory(self):
+        """Test files give the same result as parsing their contents."""
+        for content in (fixtures.scalars_hedl, fixtures.error_invalid_syntax):
+            with open(self.path, "wb") as f:
+                f.write(content)
+            self.assertEqual(validate_file(self.path), validate(content))
+        with open(self.path, "wb") as f:
+            f.write(fixtures.scalars_hedl)
+        with parse_file(self.path) as from_file, parse(fixtures.scalars_hedl) as from_memory:
+            self.assertEqual(from_file.to_json(), from_memory.to_json())
+
+    def test_file_over_ffi_limit(self):
+        """Test a file too large for the FFI length argument raises error."""
+        # Sparse, so no disk space is used; the size check runs before mapping
+        with open(self.path, "r+b") as f:
+            f.truncate(2**32 + 1)
+        with self.assertRaises(HedlError) as ctx:
+            validate_file(self.path)
+        self.assertIn("FFI limit", str(ctx.exception))
+        with self.assertRaises(HedlError):
+            parse_file(self.path)
+
+    def test_parse_file_invalid(self):
+        """Test parsing an invalid file raises error."""
+        with open(self.path, "wb") as f:
+            f.write(fixtures.error_invalid_syntax)
+        with self.assertRaises(HedlError):
+            parse_file(self.path)
+
+    def test_parse_file_input_limit(self):
+        """Test an oversized file raises error."""
+        with self.assertRaises(HedlError):
+            parse_file(self.path, limiter=ResourceLimiter(max_input_size=1))
+
+    def test_validate_file_invalid(self):
+        """Test validating an invalid file."""
+        with open(self.path, "wb") as f:
+            f.write(fixtures.error_invalid_syntax)
+        self.assertFalse(validate_file(self.path))
+
+
+class TestDocumentProperties(unittest.TestCase):
+    """Test Document properties."""
+
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read from the document, so one parse serves them all
+        cls.doc = parse(SAMPLE_HEDL)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.doc.close()
 
     def test_version(self):
         """Test version property."""
@@ -71,21 +173,39 @@ class TestDocumentProperties(unittest.TestCase):
 class TestConversions(unittest.TestCase):
     """Test format conversion methods."""
 
-    def setUp(self):
-        self.doc = parse(SAMPLE_HEDL)
-
-    def tearDown(self):
-        self.doc.close()
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read from the document, so one parse and one
+        # conversion per format serves them all
+        cls.doc = parse(SAMPLE_HEDL)
+        try:
+            cls.outputs = {
+                "canonical": cls.doc.canonicalize(),
+                "json": cls.doc.to_json(),
+                "yaml": cls.doc.to_yaml(),
+                "xml": cls.doc.to_xml(),
+                "csv": cls.doc.to_csv(),
+                "cypher": cls.doc.to_cypher(),
+                "parquet": cls.doc.to_parquet(),
+            }
+        except BaseException:
+            # tearDownClass is skipped when setUpClass fails
+            cls.doc.close()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.doc.close()
 
     def test_canonicalize(self):
         """Test canonicalization."""
-        canonical = self.doc.canonicalize()
+        canonical = self.outputs["canonical"]
         self.assertIsInstance(canonical, str)
         self.assertIn('%VERSION', canonical)
 
     def test_to_json(self):
         """Test JSON conversion."""
-        json_str = self.doc.to_json()
+        json_str = self.outputs["json"]
         self.assertIsInstance(json_str, str)
         self.assertIn('users', json_str)
 
@@ -94,45 +214,81 @@ class TestConversions(unittest.TestCase):
         json_str = self.doc.to_json(include_metadata=True)
         self.assertIsInstance(json_str, str)
 
+    def test_to_json_into(self):
+        """Test JSON conversion into a caller-supplied buffer."""
+        buf = bytearray(1 << 16)
+        length = self.doc.to_json_into(buf)
+        self.assertEqual(bytes(buf[:length]).decode("utf-8"), self.outputs["json"])
+
+    def test_to_json_into_small_buffer(self):
+        """Test a too-small buffer raises error."""
+        with self.assertRaises(HedlError):
+            self.doc.to_json_into(bytearray(1))
+
     def test_to_yaml(self):
         """Test YAML conversion."""
-        yaml_str = self.doc.to_yaml()
+        yaml_str = self.outputs["yaml"]
         self.assertIsInstance(yaml_str, str)
 
     def test_to_xml(self):
         """Test XML conversion."""
-        xml_str = self.doc.to_xml()
+        xml_str = self.outputs["xml"]
         self.assertIsInstance(xml_str, str)
         self.assertIn('<', xml_str)
 
     def test_to_csv(self):
         """Test CSV conversion."""
-        csv_str = self.doc.to_csv()
+        csv_str = self.outputs["csv"]
         self.assertIsInstance(csv_str, str)
 
     def test_to_cypher(self):
         """Test Neo4j Cypher conversion."""
-        cypher = self.doc.to_cypher()
+        cypher = self.outputs["cypher"]
         self.assertIsInstance(cypher, str)
 
     def test_to_parquet(self):
         """Test Parquet conversion."""
-        data = self.doc.to_parquet()
+        data = self.outputs["parquet"]
         self.assertIsInstance(data, bytes)
         self.assertGreater(len(data), 0)
 
+    def test_to_parquet_view(self):
+        """Test zero-copy Parquet conversion."""
+        with self.doc.to_parquet_view() as view:
+            self.assertIsInstance(view, memoryview)
+            self.assertTrue(view.readonly)
+            self.assertEqual(bytes(view), self.outputs["parquet"])
+
+    def test_write_parquet(self):
+        """Test writing Parquet output to a file object."""
+        buf = io.BytesIO()
+        written = self.doc.write_parquet(buf)
+        self.assertEqual(buf.getvalue(), self.outputs["parquet"])
+        self.assertEqual(written, len(buf.getvalue()))
+
+    def test_to_json_view(self):
+        """Test JSON conversion to a UTF-8 memoryview."""
+        view = self.doc.to_json_view()
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(bytes(view).decode("utf-8"), self.outputs["json"])
+
 
 class TestFromFormats(unittest.TestCase):
     """Test parsing from other formats."""
 
     def test_from_json(self):
         """Test parsing from JSON."""
-        doc = from_json(SAMPLE_JSON)
+        doc = from_json(fixtures.as_str.basic_json)
         self.assertIsInstance(doc, Document)
         hedl = doc.canonicalize()
         self.assertIn('users', hedl)
         doc.close()
 
+    def test_from_json_bytes(self):
+        """Test parsing from pre-encoded JSON."""
+        with from_json_bytes(SAMPLE_JSON) as doc:
+            self.assertIn('users', doc.canonicalize())
+
     def test_from_yaml(self):
         """Test parsing from YAML."""
         doc = from_yaml(SAMPLE_YAML)
@@ -165,6 +321,65 @@ class TestLinting(unittest.TestCase):
                 items = list(diag)
                 self.assertIsInstance(items, list)
 
+    def test_diagnostics_categories(self):
+        """Test errors/warnings/hints partition the iterated diagnostics."""
+        with parse(SAMPLE_HEDL) as doc:
+            with doc.lint() as diag:
+                items = list(diag)
+                categorized = diag.errors + diag.warnings + diag.hints
+                self.assertEqual(sorted(categorized), sorted(msg for msg, _ in items))
+                self.assertEqual(list(diag), items)
+            self.assertEqual(diag.errors, [])
+
+    def test_parse_and_lint(self):
+        """Test parsing and linting in a single call."""
+        doc, diag = parse_and_lint(SAMPLE_HEDL)
+        with doc, diag:
+            self.assertIsInstance(doc, Document)
+            self.assertIsInstance(diag, Diagnostics)
+            self.assertEqual(doc.version, (1, 0))
+
+    def test_parse_and_lint_invalid(self):
+        """Test parse_and_lint raises on invalid content."""
+        with self.assertRaises(HedlError):
+            parse_and_lint(fixtures.error_invalid_syntax)
+
+
+class TestResourceLimiter(unittest.TestCase):
+    """Test per-document resource limits."""
+
+    def test_default_limiter(self):
+        """Test documents without a limiter use the module default."""
+        from hedl.core import DEFAULT_LIMITER, MAX_OUTPUT_SIZE
+        with parse(SAMPLE_HEDL) as doc:
+            self.assertIs(doc._limiter, DEFAULT_LIMITER)
+        self.assertEqual(DEFAULT_LIMITER.max_output_size, MAX_OUTPUT_SIZE)
+
+    def test_output_limit(self):
+        """Test a per-document output limit is enforced."""
+        limiter = ResourceLimiter(max_output_size=1)
+        with parse(SAMPLE_HEDL, limiter=limiter) as doc:
+            with self.assertRaises(HedlError) as ctx:
+                doc.to_json()
+            self.assertIn("Output size", str(ctx.exception))
+            limiter.max_output_size = 1 << 20
+            self.assertIsInstance(doc.to_json(), str)
+
+    def test_input_limit(self):
+        """Test a per-call input limit is enforced."""
+        limiter = ResourceLimiter(max_input_size=1)
+        with self.assertRaises(HedlError) as ctx:
+            parse(SAMPLE_HEDL, limiter=limiter)
+        self.assertIn("Input size", str(ctx.exception))
+
+    def test_ffi_input_length_limit(self):
+        """Test inputs too long for the FFI length argument are rejected."""
+        with mock.patch("hedl.core._MAX_FFI_INPUT_LEN", len(SAMPLE_HEDL) - 1):
+            for func in (parse_bytes, validate_bytes, validate, from_json_bytes):
+                with self.assertRaises(HedlError) as ctx:
+                    func(SAMPLE_HEDL)
+                self.assertIn("FFI limit", str(ctx.exception))
+
 
 class TestMemoryManagement(unittest.TestCase):
     """Test proper memory management."""
@@ -176,6 +391,98 @@ class TestMemoryManagement(unittest.TestCase):
         # Should not raise on double close
         doc.close()
 
+    def test_document_in_cycle_is_released(self):
+        """Test an unclosed Document in a reference cycle is still freed."""
+        clear_parse_cache()
+        doc = parse(SAMPLE_HEDL)
+        # Holding the finalizer, not the handle, lets the handle be collected
+        free = doc._handle._free
+        clear_parse_cache()
+        cycle = [doc]
+        cycle.append(cycle)
+        del doc, cycle
+        gc.collect()
+        self.assertFalse(free.alive)
+
+    def test_slots(self):
+        """Test Document and Diagnostics carry no per-instance __dict__."""
+        with parse(SAMPLE_HEDL) as doc, doc.lint() as diag:
+            self.assertFalse(hasattr(doc, "__dict__"))
+            self.assertFalse(hasattr(diag, "__dict__"))
+
+    def test_cached_parse_shares_handle(self):
+        """Test re-parsing identical content reuses the cached handle."""
+        clear_parse_cache()
+        first = parse(SAMPLE_HEDL, cache=True)
+        second = parse(SAMPLE_HEDL, cache=True)
+        self.assertIs(first._handle, second._handle)
+        first.close()
+        # The shared handle stays alive while another Document holds it
+        self.assertEqual(second.version, (1, 0))
+        second.close()
+        free = second._handle._free
+        self.assertTrue(free.alive)
+        clear_parse_cache()
+        self.assertFalse(free.alive)
+
+    def test_uncached_parse_is_freed_on_close(self):
+        """Test parse() without cache gives each Document its own handle."""
+        first = parse(SAMPLE_HEDL)
+        second = parse(SAMPLE_HEDL)
+        self.assertIsNot(first._handle, second._handle)
+        free = first._handle._free
+        first.close()
+        self.assertFalse(free.alive)
+        self.assertEqual(second.version, (1, 0))
+        second.close()
+
+    def test_parse_cache_byte_bound(self):
+        """Test sources over the cache's byte bound are not cached."""
+        clear_parse_cache()
+        with mock.patch("hedl.core._parse_cache.max_bytes", len(SAMPLE_HEDL) - 1):
+            first = parse(SAMPLE_HEDL, cache=True)
+            second = parse(SAMPLE_HEDL, cache=True)
+            self.assertIsNot(first._handle, second._handle)
+            first.close()
+            second.close()
+        clear_parse_cache()
+
+    def test_concurrent_parse(self):
+        """Test parse(cache=True) from several threads at once."""
+        clear_parse_cache()
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(50):
+                    with parse(SAMPLE_HEDL, cache=True) as doc:
+                        self.assertEqual(doc.version, (1, 0))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        clear_parse_cache()
+
+    def test_reparse_closed_document(self):
+        """Test reparse reopens a closed document."""
+        doc = parse(SAMPLE_HEDL)
+        doc.close()
+        doc.reparse(SAMPLE_HEDL)
+        self.assertEqual(doc.version, (1, 0))
+        doc.close()
+
+    def test_reparse_invalid_keeps_document(self):
+        """Test failed reparse leaves the document usable."""
+        with parse(SAMPLE_HEDL) as doc:
+            with self.assertRaises(HedlError):
+                doc.reparse(fixtures.error_invalid_syntax)
+            self.assertEqual(doc.version, (1, 0))
+
     def test_context_manager_closes(self):
         """Test context manager properly closes."""
         with parse(SAMPLE_HEDL) as doc:
@@ -8,34 +8,65 @@ Tests verify that:
 4. Context managers work with type checkers
 """
 
+import ast
+import functools
+import inspect
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+import hedl
+
 # Type checking imports
 if TYPE_CHECKING:
     from typing import Any, Optional, Union
 
 
-def test_py_typed_marker_exists():
-    """Verify py.typed marker file exists for PEP 561 compliance."""
-    import hedl
+# Signatures never change within a run, so introspect each function once
+_sig = functools.lru_cache(maxsize=None)(inspect.signature)
+
+
+@pytest.fixture(scope="session")
+def hedl_module_path():
+    """Directory of the installed hedl package, resolved once per session."""
+    return Path(hedl.__file__).parent
 
-    module_path = Path(hedl.__file__).parent
-    py_typed = module_path / "py.typed"
+
+@pytest.fixture(scope="session")
+def stub_files(hedl_module_path):
+    """All .pyi stub files of the package, globbed once per session."""
+    return list(hedl_module_path.glob("*.pyi"))
+
+
+@pytest.fixture(scope="session")
+def stub_asts(stub_files):
+    """Parsed AST of each stub file; one read and one parse shared between tests."""
+    trees = {}
+    for stub_file in stub_files:
+        try:
+            trees[stub_file] = ast.parse(
+                stub_file.read_text(),
+                filename=str(stub_file),
+                type_comments=False,
+                feature_version=sys.version_info[:2],
+            )
+        except SyntaxError as e:
+            pytest.fail(f"Syntax error in {stub_file.name}: {e}")
+    return trees
+
+
+def test_py_typed_marker_exists(hedl_module_path):
+    """Verify py.typed marker file exists for PEP 561 compliance."""
+    py_typed = hedl_module_path / "py.typed"
 
     assert py_typed.exists(), "py.typed marker file must exist"
     assert py_typed.is_file(), "py.typed must be a file"
 
 
-def test_stub_files_exist():
+def test_stub_files_exist(hedl_module_path):
     """Verify all .pyi stub files exist."""
-    import hedl
-
-    module_path = Path(hedl.__file__).parent
-
     required_stubs = [
         "__init__.pyi",
         "core.pyi",
@@ -43,160 +74,154 @@ def test_stub_files_exist():
     ]
 
     for stub_name in required_stubs:
-        stub_path = module_path / stub_name
+        stub_path = hedl_module_path / stub_name
         assert stub_path.exists(), f"{stub_name} must exist"
         assert stub_path.is_file(), f"{stub_name} must be a file"
 
 
-def test_stub_syntax_valid():
+def test_stub_syntax_valid(stub_asts):
     """Verify stub files are syntactically valid Python."""
-    import hedl
-    import ast
+    # Parsing happens in the stub_asts fixture, which fails on a SyntaxError
+    assert len(stub_asts) > 0, "No stub files found"
+
+
+ERROR_CODES = (
+    "HEDL_OK",
+    "HEDL_ERR_NULL_PTR",
+    "HEDL_ERR_INVALID_UTF8",
+    "HEDL_ERR_PARSE",
+    "HEDL_ERR_CANONICALIZE",
+    "HEDL_ERR_JSON",
+    "HEDL_ERR_ALLOC",
+    "HEDL_ERR_YAML",
+    "HEDL_ERR_XML",
+    "HEDL_ERR_CSV",
+    "HEDL_ERR_PARQUET",
+    "HEDL_ERR_LINT",
+    "HEDL_ERR_NEO4J",
+)
+
+SEVERITIES = (
+    "SEVERITY_HINT",
+    "SEVERITY_WARNING",
+    "SEVERITY_ERROR",
+)
+
+PUBLIC_API = (
+    "Document",
+    "Diagnostics",
+    "HedlError",
+    "parse",
+    "validate",
+    "from_json",
+    "from_yaml",
+    "from_xml",
+    "from_parquet",
+    "get_library_path",
+    "load_library",
+)
+
+DOCUMENT_METHODS = (
+    "close",
+    "canonicalize",
+    "to_json",
+    "to_yaml",
+    "to_xml",
+    "to_csv",
+    "to_parquet",
+    "to_cypher",
+    "lint",
+)
+
+DOCUMENT_PROPERTIES = (
+    "version",
+    "schema_count",
+    "alias_count",
+    "root_item_count",
+)
+
+DIAGNOSTICS_MEMBERS = (
+    # Methods
+    "close",
+    "get",
+    # Properties
+    "errors",
+    "warnings",
+    "hints",
+)
+
+
+@pytest.fixture(scope="session")
+def public_names():
+    """Names listed in hedl.__all__, collected once per session."""
+    assert hasattr(hedl, "__all__"), "__all__ must be defined"
+    return frozenset(hedl.__all__)
 
-    module_path = Path(hedl.__file__).parent
 
-    stub_files = list(module_path.glob("*.pyi"))
-    assert len(stub_files) > 0, "No stub files found"
+@pytest.fixture(scope="session")
+def document_members():
+    """Attribute names of hedl.Document, collected once per session."""
+    return frozenset(dir(hedl.Document))
 
-    for stub_file in stub_files:
-        try:
-            code = stub_file.read_text()
-            ast.parse(code, filename=str(stub_file))
-        except SyntaxError as e:
-            pytest.fail(f"Syntax error in {stub_file.name}: {e}")
 
+@pytest.fixture(scope="session")
+def diagnostics_members():
+    """Attribute names of hedl.Diagnostics, collected once per session."""
+    return frozenset(dir(hedl.Diagnostics))
 
-def test_error_codes_exported():
-    """Verify all error code constants are exported."""
-    import hedl
-
-    error_codes = [
-        "HEDL_OK",
-        "HEDL_ERR_NULL_PTR",
-        "HEDL_ERR_INVALID_UTF8",
-        "HEDL_ERR_PARSE",
-        "HEDL_ERR_CANONICALIZE",
-        "HEDL_ERR_JSON",
-        "HEDL_ERR_ALLOC",
-        "HEDL_ERR_YAML",
-        "HEDL_ERR_XML",
-        "HEDL_ERR_CSV",
-        "HEDL_ERR_PARQUET",
-        "HEDL_ERR_LINT",
-        "HEDL_ERR_NEO4J",
-    ]
 
-    for code in error_codes:
-        assert hasattr(hedl, code), f"{code} must be exported"
-        value = getattr(hedl, code)
-        assert isinstance(value, int), f"{code} must be an integer"
+@pytest.mark.parametrize("code", ERROR_CODES)
+def test_error_codes_exported(code):
+    """Verify all error code constants are exported."""
+    assert hasattr(hedl, code), f"{code} must be exported"
+    assert isinstance(getattr(hedl, code), int), f"{code} must be an integer"
 
 
-def test_severity_levels_exported():
+@pytest.mark.parametrize("severity", SEVERITIES)
+def test_severity_levels_exported(severity):
     """Verify severity level constants are exported."""
-    import hedl
+    assert hasattr(hedl, severity), f"{severity} must be exported"
+    assert isinstance(getattr(hedl, severity), int), f"{severity} must be an integer"
 
-    severities = [
-        "SEVERITY_HINT",
-        "SEVERITY_WARNING",
-        "SEVERITY_ERROR",
-    ]
 
-    for severity in severities:
-        assert hasattr(hedl, severity), f"{severity} must be exported"
-        value = getattr(hedl, severity)
-        assert isinstance(value, int), f"{severity} must be an integer"
-
-
-def test_public_api_exported():
+@pytest.mark.parametrize("name", PUBLIC_API)
+def test_public_api_exported(name, public_names):
     """Verify all public API is exported in __all__."""
-    import hedl
-
-    expected_exports = [
-        "Document",
-        "Diagnostics",
-        "HedlError",
-        "parse",
-        "validate",
-        "from_json",
-        "from_yaml",
-        "from_xml",
-        "from_parquet",
-        "get_library_path",
-        "load_library",
-    ]
-
-    assert hasattr(hedl, "__all__"), "__all__ must be defined"
-    all_exports = set(hedl.__all__)
-
-    for name in expected_exports:
-        assert name in all_exports, f"{name} must be in __all__"
-        assert hasattr(hedl, name), f"{name} must be exported"
+    assert name in public_names, f"{name} must be in __all__"
+    assert hasattr(hedl, name), f"{name} must be exported"
 
 
 def test_document_type_annotations():
     """Verify Document class has correct type annotations."""
-    import hedl
-    import inspect
-
     # Check Document is a class
     assert inspect.isclass(hedl.Document), "Document must be a class"
 
-    # Check it has expected methods
-    expected_methods = [
-        "close",
-        "canonicalize",
-        "to_json",
-        "to_yaml",
-        "to_xml",
-        "to_csv",
-        "to_parquet",
-        "to_cypher",
-        "lint",
-    ]
 
-    for method in expected_methods:
-        assert hasattr(hedl.Document, method), f"Document must have {method} method"
+@pytest.mark.parametrize("method", DOCUMENT_METHODS)
+def test_document_methods(method, document_members):
+    """Verify Document has the expected methods."""
+    assert method in document_members, f"Document must have {method} method"
 
 
-def test_document_properties():
+@pytest.mark.parametrize("prop", DOCUMENT_PROPERTIES)
+def test_document_properties(prop, document_members):
     """Verify Document has correct properties."""
-    import hedl
-
-    # These should be properties
-    expected_properties = [
-        "version",
-        "schema_count",
-        "alias_count",
-        "root_item_count",
-    ]
-
-    for prop in expected_properties:
-        assert hasattr(hedl.Document, prop), f"Document must have {prop} property"
+    assert prop in document_members, f"Document must have {prop} property"
 
 
 def test_diagnostics_type_annotations():
     """Verify Diagnostics class has correct type annotations."""
-    import hedl
-    import inspect
-
     assert inspect.isclass(hedl.Diagnostics), "Diagnostics must be a class"
 
-    # Check methods
-    expected_methods = ["close", "get"]
-    for method in expected_methods:
-        assert hasattr(hedl.Diagnostics, method), f"Diagnostics must have {method}"
 
-    # Check properties
-    expected_properties = ["errors", "warnings", "hints"]
-    for prop in expected_properties:
-        assert hasattr(hedl.Diagnostics, prop), f"Diagnostics must have {prop}"
+@pytest.mark.parametrize("member", DIAGNOSTICS_MEMBERS)
+def test_diagnostics_members(member, diagnostics_members):
+    """Verify Diagnostics has the expected methods and properties."""
+    assert member in diagnostics_members, f"Diagnostics must have {member}"
 
 
 def test_hedl_error_structure():
     """Verify HedlError exception structure."""
-    import hedl
-
     # HedlError should be an exception
     assert issubclass(hedl.HedlError, Exception), "HedlError must inherit from Exception"
 
@@ -209,10 +234,7 @@ def test_hedl_error_structure():
 
 def test_parse_function_signature():
     """Verify parse function accepts correct types."""
-    import hedl
-    import inspect
-
-    sig = inspect.signature(hedl.parse)
+    sig = _sig(hedl.parse)
     params = sig.parameters
 
     # Check parameters
@@ -225,10 +247,7 @@ def test_parse_function_signature():
 
 def test_validate_function_signature():
     """Verify validate function signature."""
-    import hedl
-    import inspect
-
-    sig = inspect.signature(hedl.validate)
+    sig = _sig(hedl.validate)
     params = sig.parameters
 
     assert "content" in params
@@ -237,29 +256,24 @@ def test_validate_function_signature():
 
 def test_conversion_functions_signature():
     """Verify from_* conversion functions have correct signatures."""
-    import hedl
-    import inspect
-
     converters = [
         ("from_json", ["content"]),
         ("from_yaml", ["content"]),
         ("from_xml", ["content"]),
         ("from_parquet", ["content"]),
     ]
+    params = {
+        func_name: _sig(getattr(hedl, func_name)).parameters.keys()
+        for func_name, _ in converters
+    }
 
     for func_name, expected_params in converters:
-        func = getattr(hedl, func_name)
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-
-        for expected in expected_params:
-            assert expected in params, f"{func_name} must have '{expected}' parameter"
+        missing = set(expected_params) - params[func_name]
+        assert not missing, f"{func_name} must have {sorted(missing)} parameter(s)"
 
 
 def test_context_manager_protocol():
     """Verify Document and Diagnostics implement context manager protocol."""
-    import hedl
-
     # Document should have __enter__ and __exit__
     assert hasattr(hedl.Document, "__enter__")
     assert hasattr(hedl.Document, "__exit__")
@@ -271,8 +285,6 @@ def test_context_manager_protocol():
 
 def test_diagnostics_iteration_protocol():
     """Verify Diagnostics implements iteration protocol."""
-    import hedl
-
     assert hasattr(hedl.Diagnostics, "__len__")
     assert hasattr(hedl.Diagnostics, "__iter__")
 
@@ -280,7 +292,6 @@ def test_diagnostics_iteration_protocol():
 @pytest.mark.skipif(sys.version_info < (3, 9), reason="Type hints require Python 3.9+")
 def test_runtime_type_hints():
     """Verify runtime type hints are accessible (Python 3.9+)."""
-    import hedl
     from typing import get_type_hints
 
     # Should be able to get type hints without errors
@@ -294,8 +305,6 @@ def test_runtime_type_hints():
 
 def test_version_attribute():
     """Verify __version__ attribute exists and is correct type."""
-    import hedl
-
     assert hasattr(hedl, "__version__")
     assert isinstance(hedl.__version__, str)
 
@@ -304,23 +313,15 @@ def test_version_attribute():
     assert len(parts) >= 2, "Version should be in semantic format (e.g., 1.0.0)"
 
 
-def test_stub_docstrings():
+def test_stub_docstrings(stub_asts):
     """Verify stub files contain docstrings."""
-    import hedl
-
-    module_path = Path(hedl.__file__).parent
-
-    for stub_file in module_path.glob("*.pyi"):
-        content = stub_file.read_text()
-
+    for stub_file, tree in stub_asts.items():
         # Should have module docstring
-        assert '"""' in content, f"{stub_file.name} should have docstrings"
+        assert ast.get_docstring(tree) is not None, f"{stub_file.name} should have docstrings"
 
 
 def test_type_completeness():
     """Verify all runtime exports have type stubs."""
-    import hedl
-
     # Get all public names from runtime
     runtime_names = {
         name for name in dir(hedl)